@@ -23,6 +23,11 @@ class APIError(Exception):
     HTTP status code and error message.
     """
 
+    # Fields live in slots rather than the instance __dict__ (BaseException
+    # still provides one, but it stays empty), which makes errors smaller
+    # and cheaper to construct
+    __slots__ = ("message", "code", "status_code", "details")
+
     def __init__(
         self,
         message: str,
@@ -36,10 +41,25 @@ class APIError(Exception):
         self.status_code = status_code
         self.details = details or {}
 
+    def __reduce__(self):
+        # BaseException pickles only args and __dict__, so carry the slots
+        state = {name: getattr(self, name) for name in APIError.__slots__}
+        return _restore_error, (type(self), self.args, state)
+
+
+def _restore_error(cls, args, state):
+    """Rebuild a pickled APIError without re-running its __init__."""
+    error = cls.__new__(cls, *args)
+    for name, value in state.items():
+        setattr(error, name, value)
+    return error
+
 
 class ValidationError(APIError):
     """Request validation failed."""
 
+    __slots__ = ()
+
     def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
         super().__init__(
             message=message,
@@ -52,10 +72,13 @@ class ValidationError(APIError):
 class NotFoundError(APIError):
     """Requested resource not found."""
 
+    __slots__ = ()
+
     def __init__(self, resource: str, identifier: Any = None):
-        message = f"{resource} not found"
         if identifier:
             message = f"{resource} with id '{identifier}' not found"
+        else:
+            message = f"{resource} not found"
         super().__init__(
             message=message,
             code="NOT_FOUND",
@@ -67,6 +90,8 @@ class NotFoundError(APIError):
 class ConflictError(APIError):
     """Resource conflict (e.g., duplicate entry)."""
 
+    __slots__ = ()
+
     def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
         super().__init__(
             message=message,
@@ -79,6 +104,8 @@ class ConflictError(APIError):
 class ServiceUnavailableError(APIError):
     """External service is unavailable."""
 
+    __slots__ = ()
+
     def __init__(self, service: str, message: Optional[str] = None):
         super().__init__(
             message=message or f"{service} service is temporarily unavailable",
@@ -91,6 +118,8 @@ class ServiceUnavailableError(APIError):
 class RateLimitError(APIError):
     """Rate limit exceeded."""
 
+    __slots__ = ()
+
     def __init__(self, retry_after: Optional[int] = None):
         details = {}
         if retry_after:
@@ -109,12 +138,9 @@ def format_error_response(
     details: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
     """Format a consistent error response structure."""
-    response = {
-        "error": {
-            "code": code,
-            "message": message,
-        }
-    }
+    # Fill the inner dict before wrapping it, so details don't need a
+    # second lookup through response["error"]
+    error = {"code": code, "message": message}
     if details:
-        response["error"]["details"] = details
-    return response
+        error["details"] = details
+    return {"error": error}
@@ -55,18 +55,17 @@ def test_selector():
         return jsonify({"error": "URL and selector_value are required"}), 400
 
     try:
-        from core.scraping.extractors.css_extractor import CSSExtractor
-        from core.scraping.extractors.xpath_extractor import XPathExtractor
+        engine = get_engine()
 
         # Fetch the page
-        html_result = get_engine().fetch_page(url)
+        html_result = engine.fetch_page(url)
         html = html_result.get("html", "")
 
-        # Test extraction
+        # Test extraction with the engine's extractors (same backend as scraping)
         if selector_type == "css":
-            extractor = CSSExtractor()
+            extractor = engine.css_extractor
         else:
-            extractor = XPathExtractor()
+            extractor = engine.xpath_extractor
 
         matches = extractor.extract_all(html, selector_value, attribute)
 
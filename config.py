@@ -76,6 +76,10 @@ FALLBACK_STATUS_CODES = [403, 429, 503]
 FALLBACK_ERROR_PATTERNS = ["blocked", "captcha", "cloudflare", "challenge", "denied", "rate limit"]
 FALLBACK_POISON_PILLS = ["anti_bot", "rate_limited"]
 
+# CSS extraction backend: "lxml" (default) or "selectolax" (pip install selectolax),
+# which parses with Lexbor and is faster for simple selectors on single-use pages
+CSS_BACKEND = os.getenv("CSS_BACKEND", "lxml")
+
 # Agent-browser configuration
 AGENT_BROWSER_PATH = os.getenv("AGENT_BROWSER_PATH", "agent-browser")
 AGENT_BROWSER_TIMEOUT = 60000  # Allow more time for CLI tool
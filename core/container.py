@@ -278,8 +278,18 @@ class Container:
 
 
 # Global container singleton
-_container: Optional[Container] = None
-_container_lock = threading.Lock()
+class _ContainerHolder:
+    """
+    Holder for the global container.
+
+    The instance is created while the class body runs, which happens
+    under the module import lock, so the read path needs no locking.
+    """
+
+    instance = Container()
+
+
+_reset_lock = threading.Lock()
 
 
 def get_container() -> Container:
@@ -291,12 +301,7 @@ def get_container() -> Container:
     Returns:
         The global Container instance
     """
-    global _container
-    if _container is None:
-        with _container_lock:
-            if _container is None:
-                _container = Container()
-    return _container
+    return _ContainerHolder.instance
 
 
 def reset_container() -> None:
@@ -305,11 +310,9 @@ def reset_container() -> None:
 
     Useful for testing to get a fresh container.
     """
-    global _container
-    with _container_lock:
-        if _container is not None:
-            _container.reset()
-        _container = None
+    with _reset_lock:
+        _ContainerHolder.instance.reset()
+        _ContainerHolder.instance = Container()
 
 
 def configure_default_services(container: Container) -> Container:
@@ -1,11 +1,98 @@
 """Poison pill detector for identifying content issues."""
 
 import re
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Tuple
 
 from core.poison_pills.types import PoisonPillType, PoisonPillResult
 import config
 
+try:
+    import re2
+    HAS_RE2 = True
+except ImportError:
+    HAS_RE2 = False
+
+# Regex engines accepted by PoisonPillDetector
+ENGINES = ("auto", "re", "re2")
+
+_TAG_RE = re.compile(r'<[^>]+>')
+_TITLE_RE = re.compile(r'<title[^>]*>([^<]+)</title>')
+
+RATE_LIMIT_PATTERNS = (
+    r"rate\s*limit",
+    r"too\s+many\s+requests",
+    r"request\s+limit\s+exceeded",
+    r"slow\s+down",
+    r"try\s+again\s+(later|in\s+\d+)",
+    r"temporarily\s+blocked",
+    r"quota\s+exceeded",
+    r"api\s+limit",
+    r"throttl(ed|ing)",
+)
+
+LOGIN_PATTERNS = (
+    r"please\s+(log|sign)\s*in",
+    r"(log|sign)\s*in\s+to\s+(view|read|continue)",
+    r"create\s+an?\s+account\s+to",
+    r"members?\s+only\s+content",
+)
+
+
+# What Python's \s and \d match in str patterns, as RE2 class contents.
+# RE2's own \s and \d are ASCII-only, so "try\xa0again" would slip past.
+_RE2_CLASS_ESCAPES = {
+    "s": r"\t-\r\x{1c}-\x{20}\x{85}\x{a0}\x{1680}\x{2000}-\x{200a}"
+         r"\x{2028}\x{2029}\x{202f}\x{205f}\x{3000}",
+    "d": r"\p{Nd}",
+}
+
+
+def _to_re2(pattern: str) -> str:
+    r"""Rewrite \s and \d so RE2 matches the same characters as the re module."""
+    out = []
+    in_class = False
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\" and i + 1 < len(pattern):
+            escaped = pattern[i + 1]
+            if escaped in _RE2_CLASS_ESCAPES:
+                body = _RE2_CLASS_ESCAPES[escaped]
+                out.append(body if in_class else f"[{body}]")
+            else:
+                out.append(pattern[i:i + 2])
+            i += 2
+            continue
+        if char == "[" and not in_class:
+            in_class = True
+            # A "]" right after "[" or "[^" is a literal, not the end of the class
+            end = i + 2 if pattern.startswith("^", i + 1) else i + 1
+            if pattern.startswith("]", end):
+                end += 1
+            out.append(pattern[i:end])
+            i = end
+            continue
+        if char == "]" and in_class:
+            in_class = False
+        out.append(char)
+        i += 1
+    return "".join(out)
+
+
+@lru_cache(maxsize=32)
+def _compile_patterns(patterns: Tuple[str, ...], use_re2: bool) -> tuple:
+    """
+    Compile a pattern set for "does any of these occur" scans.
+
+    With RE2 the set becomes a single alternation scanned in one linear
+    pass. The stdlib engine keeps one regex per pattern: joining them
+    defeats its literal-prefix search and measures slower.
+    """
+    if use_re2:
+        return (re2.compile("|".join(f"(?:{_to_re2(pattern)})" for pattern in patterns)),)
+    return tuple(re.compile(pattern) for pattern in patterns)
+
 
 class PoisonPillDetector:
     """
@@ -17,6 +104,27 @@ class PoisonPillDetector:
     MIN_CONTENT_LENGTH = 500
     MIN_WORD_COUNT = 50
 
+    def __init__(self, engine: str = "auto"):
+        """
+        Initialize the detector.
+
+        Args:
+            engine: Regex engine for pattern scans - "re2" (requires
+                google-re2), "re" (stdlib), or "auto" to prefer re2 when
+                it is installed
+        """
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown engine '{engine}', expected one of {ENGINES}")
+        if engine == "re2" and not HAS_RE2:
+            raise ImportError("google-re2 not installed. Run: pip install google-re2")
+        self.engine = engine
+        self._use_re2 = engine == "re2" or (engine == "auto" and HAS_RE2)
+
+    def _matches_any(self, patterns, html_lower: str) -> bool:
+        """Check whether any of the patterns occurs in the content."""
+        compiled = _compile_patterns(tuple(patterns), self._use_re2)
+        return any(regex.search(html_lower) for regex in compiled)
+
     def detect(self, html: str, url: str = "") -> PoisonPillResult:
         """
         Check HTML content for poison pills.
@@ -40,33 +148,36 @@ class PoisonPillDetector:
         if result.is_poison:
             return result
 
+        # Pattern checks are case-insensitive; lowercase the page once
+        html_lower = html.lower()
+
         # Check for paywall
-        result = self._check_paywall(html)
+        result = self._check_paywall(html_lower)
         if result.is_poison:
             return result
 
         # Check for rate limiting (before anti-bot, since anti-bot patterns include "rate limit")
-        result = self._check_rate_limited(html)
+        result = self._check_rate_limited(html_lower)
         if result.is_poison:
             return result
 
         # Check for anti-bot
-        result = self._check_anti_bot(html)
+        result = self._check_anti_bot(html_lower)
         if result.is_poison:
             return result
 
         # Check for CAPTCHA
-        result = self._check_captcha(html)
+        result = self._check_captcha(html_lower)
         if result.is_poison:
             return result
 
         # Check for login required
-        result = self._check_login_required(html)
+        result = self._check_login_required(html_lower)
         if result.is_poison:
             return result
 
         # Check for dead link indicators
-        result = self._check_dead_link(html, url)
+        result = self._check_dead_link(html_lower, url)
         if result.is_poison:
             return result
 
@@ -74,11 +185,7 @@ class PoisonPillDetector:
 
     def _check_content_length(self, html: str) -> PoisonPillResult:
         """Check if content is too short."""
-        # Strip HTML tags for word count
-        text = re.sub(r'<[^>]+>', ' ', html)
-        text = re.sub(r'\s+', ' ', text).strip()
-        word_count = len(text.split())
-
+        # Length is O(1); check it before any regex work on the content
         if len(html) < self.MIN_CONTENT_LENGTH:
             return PoisonPillResult.detected(
                 PoisonPillType.CONTENT_TOO_SHORT,
@@ -87,6 +194,9 @@ class PoisonPillDetector:
                 retry_possible=True,
             )
 
+        # Strip HTML tags for word count (split() already collapses whitespace)
+        word_count = len(_TAG_RE.sub(' ', html).split())
+
         if word_count < self.MIN_WORD_COUNT:
             return PoisonPillResult.detected(
                 PoisonPillType.CONTENT_TOO_SHORT,
@@ -97,17 +207,14 @@ class PoisonPillDetector:
 
         return PoisonPillResult.clean()
 
-    def _check_paywall(self, html: str) -> PoisonPillResult:
+    def _check_paywall(self, html_lower: str) -> PoisonPillResult:
         """Check for paywall indicators."""
-        html_lower = html.lower()
-
-        for pattern in config.PAYWALL_PATTERNS:
-            if re.search(pattern, html_lower):
-                return PoisonPillResult.detected(
-                    PoisonPillType.PAYWALL_DETECTED,
-                    severity="high",
-                    message="Paywall detected - subscription required",
-                )
+        if self._matches_any(config.PAYWALL_PATTERNS, html_lower):
+            return PoisonPillResult.detected(
+                PoisonPillType.PAYWALL_DETECTED,
+                severity="high",
+                message="Paywall detected - subscription required",
+            )
 
         # Check for specific paywall elements
         paywall_selectors = [
@@ -127,30 +234,15 @@ class PoisonPillDetector:
 
         return PoisonPillResult.clean()
 
-    def _check_rate_limited(self, html: str) -> PoisonPillResult:
+    def _check_rate_limited(self, html_lower: str) -> PoisonPillResult:
         """Check for rate limiting indicators."""
-        html_lower = html.lower()
-
-        rate_limit_patterns = [
-            r"rate\s*limit",
-            r"too\s+many\s+requests",
-            r"request\s+limit\s+exceeded",
-            r"slow\s+down",
-            r"try\s+again\s+(later|in\s+\d+)",
-            r"temporarily\s+blocked",
-            r"quota\s+exceeded",
-            r"api\s+limit",
-            r"throttl(ed|ing)",
-        ]
-
-        for pattern in rate_limit_patterns:
-            if re.search(pattern, html_lower):
-                return PoisonPillResult.detected(
-                    PoisonPillType.RATE_LIMITED,
-                    severity="high",
-                    message="Rate limiting detected - server is throttling requests",
-                    retry_possible=True,
-                )
+        if self._matches_any(RATE_LIMIT_PATTERNS, html_lower):
+            return PoisonPillResult.detected(
+                PoisonPillType.RATE_LIMITED,
+                severity="high",
+                message="Rate limiting detected - server is throttling requests",
+                retry_possible=True,
+            )
 
         # Check for 429 status in meta tags or response indicators
         if 'status="429"' in html_lower or "429 too many" in html_lower:
@@ -163,21 +255,18 @@ class PoisonPillDetector:
 
         return PoisonPillResult.clean()
 
-    def _check_anti_bot(self, html: str) -> PoisonPillResult:
+    def _check_anti_bot(self, html_lower: str) -> PoisonPillResult:
         """Check for anti-bot protection."""
-        html_lower = html.lower()
-
         # Filter out rate limit pattern - that's handled by _check_rate_limited
         anti_bot_patterns = [p for p in config.ANTI_BOT_PATTERNS if "rate" not in p]
 
-        for pattern in anti_bot_patterns:
-            if re.search(pattern, html_lower):
-                return PoisonPillResult.detected(
-                    PoisonPillType.ANTI_BOT,
-                    severity="high",
-                    message="Anti-bot protection detected",
-                    retry_possible=True,
-                )
+        if anti_bot_patterns and self._matches_any(anti_bot_patterns, html_lower):
+            return PoisonPillResult.detected(
+                PoisonPillType.ANTI_BOT,
+                severity="high",
+                message="Anti-bot protection detected",
+                retry_possible=True,
+            )
 
         # Check for Cloudflare challenge
         if "cf-browser-verification" in html_lower or "cf_chl_opt" in html_lower:
@@ -190,10 +279,8 @@ class PoisonPillDetector:
 
         return PoisonPillResult.clean()
 
-    def _check_captcha(self, html: str) -> PoisonPillResult:
+    def _check_captcha(self, html_lower: str) -> PoisonPillResult:
         """Check for CAPTCHA challenges."""
-        html_lower = html.lower()
-
         captcha_indicators = [
             "g-recaptcha",
             "h-captcha",
@@ -212,31 +299,19 @@ class PoisonPillDetector:
 
         return PoisonPillResult.clean()
 
-    def _check_login_required(self, html: str) -> PoisonPillResult:
+    def _check_login_required(self, html_lower: str) -> PoisonPillResult:
         """Check if login is required."""
-        html_lower = html.lower()
-
-        login_patterns = [
-            r"please\s+(log|sign)\s*in",
-            r"(log|sign)\s*in\s+to\s+(view|read|continue)",
-            r"create\s+an?\s+account\s+to",
-            r"members?\s+only\s+content",
-        ]
-
-        for pattern in login_patterns:
-            if re.search(pattern, html_lower):
-                return PoisonPillResult.detected(
-                    PoisonPillType.LOGIN_REQUIRED,
-                    severity="high",
-                    message="Login required to access content",
-                )
+        if self._matches_any(LOGIN_PATTERNS, html_lower):
+            return PoisonPillResult.detected(
+                PoisonPillType.LOGIN_REQUIRED,
+                severity="high",
+                message="Login required to access content",
+            )
 
         return PoisonPillResult.clean()
 
-    def _check_dead_link(self, html: str, url: str) -> PoisonPillResult:
+    def _check_dead_link(self, html_lower: str, url: str) -> PoisonPillResult:
         """Check for dead link indicators."""
-        html_lower = html.lower()
-
         dead_indicators = [
             "page not found",
             "404 error",
@@ -258,9 +333,9 @@ class PoisonPillDetector:
                 )
 
         # Check title for 404
-        title_match = re.search(r'<title[^>]*>([^<]+)</title>', html, re.IGNORECASE)
+        title_match = _TITLE_RE.search(html_lower)
         if title_match:
-            title = title_match.group(1).lower()
+            title = title_match.group(1)
             if "404" in title or "not found" in title:
                 return PoisonPillResult.detected(
                     PoisonPillType.DEAD_LINK,
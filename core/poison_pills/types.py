@@ -20,7 +20,22 @@ class PoisonPillType(str, Enum):
     GEOGRAPHIC_BLOCK = "geographic_block"
 
 
-@dataclass
+# Built once at import; detected() looks actions up on every poison result
+_RECOMMENDED_ACTIONS = {
+    PoisonPillType.CONTENT_TOO_SHORT: "Try with Playwright for JavaScript rendering",
+    PoisonPillType.PAYWALL_DETECTED: "Skip or use authenticated session",
+    PoisonPillType.ANTI_BOT: "Use Playwright with stealth mode",
+    PoisonPillType.CAPTCHA: "Manual intervention required",
+    PoisonPillType.RATE_LIMITED: "Wait and retry with longer delays",
+    PoisonPillType.DEAD_LINK: "Mark as failed - URL no longer exists",
+    PoisonPillType.REDIRECT_LOOP: "Check URL validity",
+    PoisonPillType.MALFORMED_HTML: "Try alternative extraction",
+    PoisonPillType.LOGIN_REQUIRED: "Provide authentication credentials",
+    PoisonPillType.GEOGRAPHIC_BLOCK: "Use VPN or proxy",
+}
+
+
+@dataclass(slots=True)
 class PoisonPillResult:
     """Result of poison pill detection."""
 
@@ -54,19 +69,18 @@ class PoisonPillResult:
             retry_possible=retry_possible,
         )
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert result to dictionary for serialization."""
+        return {
+            "is_poison": self.is_poison,
+            "pill_type": self.pill_type,
+            "severity": self.severity,
+            "details": dict(self.details),
+            "recommended_action": self.recommended_action,
+            "retry_possible": self.retry_possible,
+        }
+
     @staticmethod
     def _get_recommended_action(pill_type: PoisonPillType) -> str:
         """Get recommended action for a poison pill type."""
-        actions = {
-            PoisonPillType.CONTENT_TOO_SHORT: "Try with Playwright for JavaScript rendering",
-            PoisonPillType.PAYWALL_DETECTED: "Skip or use authenticated session",
-            PoisonPillType.ANTI_BOT: "Use Playwright with stealth mode",
-            PoisonPillType.CAPTCHA: "Manual intervention required",
-            PoisonPillType.RATE_LIMITED: "Wait and retry with longer delays",
-            PoisonPillType.DEAD_LINK: "Mark as failed - URL no longer exists",
-            PoisonPillType.REDIRECT_LOOP: "Check URL validity",
-            PoisonPillType.MALFORMED_HTML: "Try alternative extraction",
-            PoisonPillType.LOGIN_REQUIRED: "Provide authentication credentials",
-            PoisonPillType.GEOGRAPHIC_BLOCK: "Use VPN or proxy",
-        }
-        return actions.get(pill_type, "Review manually")
+        return _RECOMMENDED_ACTIONS.get(pill_type, "Review manually")
@@ -27,6 +27,9 @@ from core.scraping.fetchers.agent_browser_fetcher import AgentBrowserFetcher, Ag
 from core.scraping.analyzer import HTMLAnalyzer, RuleSuggestion
 import config
 
+# Field-name cleanup, compiled once for every element in a snapshot
+_NON_WORD_RE = re.compile(r'[^a-zA-Z0-9\s]')
+
 
 def _get_singlefile_path() -> Optional[str]:
     """Get path to SingleFile CLI if available."""
@@ -716,8 +719,9 @@ class AccessibilityAnalyzer:
     def _derive_field_name(self, role: str, name: str, category: str) -> str:
         """Derive a field name from role and accessible name."""
         # Clean the name for use as a field identifier
-        clean_name = re.sub(r'[^a-zA-Z0-9\s]', '', name.lower())
-        clean_name = re.sub(r'\s+', '_', clean_name.strip())
+        clean_name = _NON_WORD_RE.sub('', name.lower())
+        # split() trims and collapses whitespace runs in one C-level pass
+        clean_name = '_'.join(clean_name.split())
 
         if len(clean_name) > 30:
             clean_name = clean_name[:30]
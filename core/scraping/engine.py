@@ -17,6 +17,7 @@ try:
 except ImportError:
     PuppeteerFetcher = None
     HAS_PUPPETEER = False
+from core.scraping.extractors.tree_cache import HTMLInput
 from core.scraping.extractors.xpath_extractor import XPathExtractor
 from core.scraping.extractors.vision_extractor import get_vision_extractor
 from core.poison_pills.detector import PoisonPillDetector
@@ -60,6 +61,26 @@ DEFAULT_CASCADE_CONFIG = {
     },
 }
 
+# Markup signs of a client-side rendered app (matched case-insensitively)
+_SPA_INDICATOR_RES = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'<div\s+id=["\']root["\']>\s*</div>',
+        r'<div\s+id=["\']app["\']>\s*</div>',
+        r'<div\s+id=["\']__next["\']',
+        r'window\.__INITIAL_STATE__',
+        r'window\.__NUXT__',
+        r'ng-app=',
+        r'data-reactroot',
+    )
+)
+
+# Used to measure visible body text without parsing the page
+_BODY_RE = re.compile(r'<body[^>]*>(.*?)</body>', re.DOTALL | re.IGNORECASE)
+_SCRIPT_RE = re.compile(r'<script[^>]*>.*?</script>', re.DOTALL | re.IGNORECASE)
+_STYLE_RE = re.compile(r'<style[^>]*>.*?</style>', re.DOTALL | re.IGNORECASE)
+_TAG_RE = re.compile(r'<[^>]+>')
+
 
 class ScrapingEngine:
     """
@@ -96,7 +117,7 @@ class ScrapingEngine:
         self._fetchers: Dict[str, Any] = {}
 
         # Extractors
-        self.css_extractor = CSSExtractor()
+        self.css_extractor = CSSExtractor(backend=config.CSS_BACKEND)
         self.xpath_extractor = XPathExtractor()
         self.poison_detector = PoisonPillDetector()
 
@@ -403,28 +424,17 @@ class ScrapingEngine:
             return True
 
         # Check for SPA frameworks
-        spa_indicators = [
-            r'<div\s+id=["\']root["\']>\s*</div>',
-            r'<div\s+id=["\']app["\']>\s*</div>',
-            r'<div\s+id=["\']__next["\']',
-            r'window\.__INITIAL_STATE__',
-            r'window\.__NUXT__',
-            r'ng-app=',
-            r'data-reactroot',
-        ]
-
-        for pattern in spa_indicators:
-            if re.search(pattern, html, re.IGNORECASE):
-                return True
+        if any(regex.search(html) for regex in _SPA_INDICATOR_RES):
+            return True
 
         # Check for minimal body content
-        body_match = re.search(r'<body[^>]*>(.*?)</body>', html, re.DOTALL | re.IGNORECASE)
+        body_match = _BODY_RE.search(html)
         if body_match:
             body_content = body_match.group(1)
             # Remove scripts and styles
-            body_content = re.sub(r'<script[^>]*>.*?</script>', '', body_content, flags=re.DOTALL | re.IGNORECASE)
-            body_content = re.sub(r'<style[^>]*>.*?</style>', '', body_content, flags=re.DOTALL | re.IGNORECASE)
-            body_content = re.sub(r'<[^>]+>', '', body_content)
+            body_content = _SCRIPT_RE.sub('', body_content)
+            body_content = _STYLE_RE.sub('', body_content)
+            body_content = _TAG_RE.sub('', body_content)
             body_content = body_content.strip()
 
             if len(body_content) < 500:
@@ -651,7 +661,7 @@ class ScrapingEngine:
 
     def test_selector(
         self,
-        html: str,
+        html: HTMLInput,
         selector_type: str,
         selector_value: str,
         attribute: Optional[str] = None,
@@ -659,6 +669,13 @@ class ScrapingEngine:
         """
         Test a selector on HTML content.
 
+        Args:
+            html: HTML string, or a tree from get_tree() when testing
+                several selectors against one page
+            selector_type: "css" or "xpath"
+            selector_value: Selector to evaluate
+            attribute: Element attribute to extract (None = text content)
+
         Returns:
             Dict with matches and count
         """
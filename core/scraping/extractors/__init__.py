@@ -3,6 +3,7 @@
 from core.scraping.extractors.base import BaseExtractor, ExtractionResult
 from core.scraping.extractors.css_extractor import CSSExtractor
 from core.scraping.extractors.xpath_extractor import XPathExtractor
+from core.scraping.extractors.tree_cache import get_tree, clear_cache
 from core.scraping.extractors.vision_extractor import (
     VisionExtractor,
     VisionExtractionResult,
@@ -21,4 +22,7 @@ __all__ = [
     "VisionExtractionResult",
     "TextRegion",
     "get_vision_extractor",
+    # Parsed-tree cache
+    "get_tree",
+    "clear_cache",
 ]
@@ -1,17 +1,312 @@
 """CSS selector-based extraction."""
 
-from typing import Optional, List, Any
-from lxml import html
-from lxml.cssselect import CSSSelector
+import re
+import sys
+from functools import lru_cache
+from typing import Optional, List, Any, Tuple, Dict
+from cssselect import SelectorError, parse as parse_css
+from lxml import etree
+from lxml.cssselect import LxmlTranslator
 
 from core.scraping.extractors.base import BaseExtractor
+from core.scraping.extractors.tree_cache import get_tree
+from core.scraping.extractors.xpath_cache import compile_xpath
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    HAS_SELECTOLAX = True
+except ImportError:
+    HAS_SELECTOLAX = False
+
+# Supported parsing/selection backends for CSSExtractor
+BACKENDS = ("lxml", "selectolax")
+
+# How element text is read when no attribute is requested:
+#   auto      - .text for leaf elements, full text_content() otherwise
+#   full      - always text_content() (all descendant text)
+#   leaf_only - only the element's own text nodes, skipping child elements
+TEXT_STRATEGIES = ("auto", "full", "leaf_only")
+
+# Same translator CSSSelector uses by default (adds :contains() support)
+_TRANSLATOR = LxmlTranslator()
+
+
+@lru_cache(maxsize=1024)
+def _css_to_xpath(selector: str) -> str:
+    """
+    Translate a CSS selector (or selector group) to an XPath expression.
+
+    Cached separately from the compiled forms below, so a selector used
+    for extraction, exists()/count() and attribute lookups is translated
+    by cssselect only once.
+
+    cssselect turns "a, b, c" into a union that libxml2 evaluates as one
+    tree walk per member. Members that only test the element itself
+    (".post-title", "[data-x]") are folded into a single
+    descendant-or-self::*[c1 or c2] step, so they share one walk. Members
+    with a tag name or combinators stay separate union members, since
+    libxml2 already matches name tests faster than a self:: predicate.
+    The union's result is the same either way: matches in document order.
+
+    Raises:
+        cssselect.SelectorError: If the selector is invalid
+    """
+    if "," not in selector:
+        return _TRANSLATOR.css_to_xpath(selector)
+
+    conditions = []
+    members = []
+    for parsed in parse_css(selector):
+        expr = _TRANSLATOR.xpath(parsed.parsed_tree) if parsed.pseudo_element is None else None
+        if expr is not None and not expr.path and expr.element == "*" and expr.condition:
+            conditions.append(expr.condition)
+        else:
+            members.append(_TRANSLATOR.selector_to_xpath(parsed, translate_pseudo_elements=True))
+
+    if len(conditions) == 1:
+        members.append(f"descendant-or-self::*[{conditions[0]}]")
+    elif conditions:
+        folded = " or ".join(f"({condition})" for condition in conditions)
+        members.append(f"descendant-or-self::*[{folded}]")
+
+    return " | ".join(members)
+
+
+@lru_cache(maxsize=512)
+def _selector_xpath(selector: str) -> Optional[str]:
+    """
+    Translate a CSS selector to XPath, or None if it is invalid.
+
+    Invalid selectors are cached as None so repeated bad input doesn't
+    go through the CSS parser again.
+    """
+    try:
+        return _css_to_xpath(selector)
+    except SelectorError:
+        return None
+
+
+def _compile_expression(expression: Optional[str], smart_strings: bool = True) -> Optional[etree.XPath]:
+    """
+    Compile a translated expression through the shared XPath cache.
+
+    The selector caches in this module hold expression strings, not
+    compiled objects: compile_xpath() decides what may be reused, and
+    :contains() expressions have to be compiled per call.
+    """
+    if expression is None:
+        return None
+    return compile_xpath(expression, smart_strings)
+
+
+def _compile(selector: str) -> Optional[etree.XPath]:
+    """
+    Get the compiled XPath for a CSS selector string.
+
+    Selectors are interned first so dynamically built strings collapse
+    onto a single object and cache lookups reuse its cached hash. For
+    most selectors the result is the same object XPathExtractor uses
+    for that XPath.
+    """
+    return _compile_expression(_selector_xpath(sys.intern(selector)))
+
+
+_TAG_SELECTOR_RE = re.compile(r"[A-Za-z][A-Za-z0-9_-]*")
+
+
+@lru_cache(maxsize=512)
+def _bare_tag(selector: str) -> Optional[str]:
+    """
+    Return the tag name if the selector is just a tag (e.g. "h1"), else None.
+
+    Bare tags translate to "descendant-or-self::tag", the same nodes
+    tree.iter(tag) yields, and iter() can stop at the first match where
+    libxml2 would evaluate the whole node-set.
+    """
+    return selector if _TAG_SELECTOR_RE.fullmatch(selector) else None
+
+
+# "tag#id.class1.class2" (tag plus an id and/or classes, nothing else)
+_SIMPLE_SELECTOR_RE = re.compile(
+    r"([A-Za-z][A-Za-z0-9_-]*)(?:#(-?[A-Za-z_][\w-]*))?((?:\.-?[A-Za-z_][\w-]*)*)"
+)
+
+
+# Class tokens are split on XML whitespace only, as normalize-space() in
+# cssselect's class test does; str.split() would also split on U+00A0 etc.
+_CLASS_SEPARATOR_RE = re.compile(r"[ \t\n\r]+")
+
+
+@lru_cache(maxsize=512)
+def _simple_selector(selector: str) -> Optional[Tuple[str, Optional[str], Tuple[str, ...]]]:
+    """
+    Split a "tag#id.class" selector into (tag, id, classes), else None.
+
+    Like bare tags, these are matched by walking tree.iter(tag), which
+    lets extract_one() stop at the first match instead of building the
+    whole node-set. Selectors without a tag would visit every element
+    in Python and stay on XPath.
+    """
+    match = _SIMPLE_SELECTOR_RE.fullmatch(selector)
+    if match is None or not (match.group(2) or match.group(3)):
+        return None
+    tag, element_id, classes = match.groups()
+    return tag, element_id, tuple(classes.split(".")[1:])
+
+
+def _first_simple_match(tree: etree._Element, simple: Tuple[str, Optional[str], Tuple[str, ...]]):
+    """First element (document order) matching a _simple_selector() result."""
+    tag, element_id, classes = simple
+    for element in tree.iter(tag):
+        if element_id is not None and element.get("id") != element_id:
+            continue
+        if classes:
+            element_classes = _CLASS_SEPARATOR_RE.split(element.get("class") or "")
+            if not all(name in element_classes for name in classes):
+                continue
+        return element
+    return None
+
+
+@lru_cache(maxsize=512)
+def _group_xpaths(selector: str) -> Optional[Tuple[str, ...]]:
+    """
+    Translate each member of a selector group ("a, b, c") separately.
+
+    Splitting uses the CSS parser, so commas inside attribute values or
+    functional pseudo-classes are not treated as separators.
+    """
+    try:
+        return tuple(_TRANSLATOR.selector_to_xpath(parsed) for parsed in parse_css(selector))
+    except SelectorError:
+        return None
+
+
+def _compile_group(selector: str) -> Optional[Tuple[etree.XPath, ...]]:
+    """Compile each member of a selector group (None if any is invalid)."""
+    expressions = _group_xpaths(selector)
+    if expressions is None:
+        return None
+    compiled = tuple(_compile_expression(expression) for expression in expressions)
+    return None if None in compiled else compiled
+
+
+# XPath wrappers that answer exists()/count() inside libxml2, so matched
+# elements never get Python proxies or a result list.
+_EXISTS_TEMPLATE = "boolean(({})[1])"
+_COUNT_TEMPLATE = "count({})"
+
+
+@lru_cache(maxsize=512)
+def _wrapped_xpath(selector: str, template: str) -> Optional[str]:
+    """Translate a CSS selector wrapped in an XPath function (None if invalid)."""
+    xpath = _selector_xpath(selector)
+    return None if xpath is None else template.format(xpath)
+
+
+def _compile_wrapped(selector: str, template: str) -> Optional[etree.XPath]:
+    """Compile a CSS selector wrapped in an XPath function (None if invalid)."""
+    return _compile_expression(_wrapped_xpath(selector, template))
+
+
+# Attribute names that can be spliced into an XPath "@name" step as-is
+_ATTRIBUTE_NAME_RE = re.compile(r"^[A-Za-z_][\w.-]*$")
+
+
+@lru_cache(maxsize=512)
+def _attribute_xpath(selector: str, attribute: str, first_only: bool) -> Optional[str]:
+    """
+    Translate a CSS selector with an XPath attribute step appended.
+
+    libxml2 returns the attribute values directly instead of elements
+    that Python then has to query one by one. ``first_only`` restricts
+    the step to the first matched element, as extract_one() reads it.
+    Returns None for invalid selectors or attribute names XPath can't
+    express; callers fall back to reading attributes from elements.
+    """
+    if not _ATTRIBUTE_NAME_RE.match(attribute):
+        return None
+    xpath = _selector_xpath(selector)
+    if xpath is None:
+        return None
+    if first_only:
+        xpath = f"({xpath})[1]"
+    return f"({xpath})/@{attribute}"
+
+
+def _compile_attribute(selector: str, attribute: str, first_only: bool) -> Optional[etree.XPath]:
+    """Compile _attribute_xpath() (None if the selector or attribute can't be expressed)."""
+    # smart_strings=False: plain str results without parent back-references
+    return _compile_expression(_attribute_xpath(selector, attribute, first_only), smart_strings=False)
+
+
+@lru_cache(maxsize=128)
+def _columns_xpath(container_selector: str, columns: Tuple[str, ...]) -> Optional[str]:
+    """
+    Build one XPath matching every column cell under a container.
+
+    The class test mirrors cssselect's translation of ".name", so the
+    single walk selects exactly what "container .name" would per column.
+    """
+    container_xpath = _selector_xpath(container_selector)
+    if container_xpath is None:
+        return None
+
+    conditions = " or ".join(
+        "contains(concat(' ', normalize-space(@class), ' '), {})".format(
+            _TRANSLATOR.xpath_literal(f" {column} ")
+        )
+        for column in columns
+    )
+    return f"({container_xpath})/descendant::*[{conditions}]"
+
+
+def _compile_columns(container_selector: str, columns: Tuple[str, ...]) -> Optional[etree.XPath]:
+    """Compile _columns_xpath() (None if the container selector is invalid)."""
+    return _compile_expression(_columns_xpath(container_selector, columns))
 
 
 class CSSExtractor(BaseExtractor):
-    """Extract data from HTML using CSS selectors."""
+    """
+    Extract data from HTML using CSS selectors.
+
+    The default "lxml" backend translates selectors to XPath. The optional
+    "selectolax" backend parses with Lexbor and matches CSS natively, which
+    is faster on small documents but has no :contains() support.
+
+    ``text_strategy`` controls how text is read (see TEXT_STRATEGIES); the
+    default "auto" gives the same result as text_content() but skips the
+    recursive walk for leaf elements.
+
+    By default a selector group such as "h1, .post-title" matches in
+    document order, as in CSS. With ``group_fallback=True``, extract_one()
+    treats the group as an ordered fallback list instead: it returns the
+    first member that yields a value and never evaluates the rest.
+    """
 
     METHOD_NAME = "css"
 
+    def __init__(
+        self,
+        backend: str = "lxml",
+        text_strategy: str = "auto",
+        group_fallback: bool = False,
+    ):
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown CSS backend: {backend!r} (expected one of {BACKENDS})")
+        if text_strategy not in TEXT_STRATEGIES:
+            raise ValueError(
+                f"Unknown text strategy: {text_strategy!r} (expected one of {TEXT_STRATEGIES})"
+            )
+        if backend == "selectolax" and not HAS_SELECTOLAX:
+            raise ImportError(
+                "selectolax is required for the selectolax backend. "
+                "Install with: pip install selectolax"
+            )
+        self.backend = backend
+        self.text_strategy = text_strategy
+        self.group_fallback = group_fallback
+
     def extract_one(
         self,
         html_content: str,
@@ -22,17 +317,47 @@ class CSSExtractor(BaseExtractor):
         Extract the first matching element.
 
         Args:
-            html_content: HTML string to parse
+            html_content: HTML string to parse (or an already-parsed lxml tree)
             selector: CSS selector
             attribute: Element attribute to extract (None = text content)
 
         Returns:
             Extracted value or None
         """
+        if self.group_fallback and "," in selector:
+            # Always evaluated with lxml, which can split selector groups
+            return self._extract_one_fallback(html_content, selector, attribute)
+
+        if self._use_lexbor(html_content):
+            return self._extract_one_lexbor(html_content, selector, attribute)
+
         try:
-            tree = html.fromstring(html_content)
-            css_selector = CSSSelector(selector)
-            elements = css_selector(tree)
+            tag = _bare_tag(selector)
+            if tag is not None:
+                element = next(get_tree(html_content).iter(tag), None)
+                if element is None:
+                    return None
+                return self._extract_value(element, attribute)
+
+            simple = _simple_selector(selector)
+            if simple is not None:
+                element = _first_simple_match(get_tree(html_content), simple)
+                if element is None:
+                    return None
+                return self._extract_value(element, attribute)
+
+            if attribute:
+                compiled_attr = _compile_attribute(sys.intern(selector), attribute, True)
+                if compiled_attr is not None:
+                    values = compiled_attr(get_tree(html_content))
+                    return values[0].strip() if values and values[0] else None
+
+            compiled = _compile(selector)
+            if compiled is None:
+                return None
+
+            tree = get_tree(html_content)
+            elements = compiled(tree)
 
             if not elements:
                 return None
@@ -43,6 +368,31 @@ class CSSExtractor(BaseExtractor):
         except Exception as e:
             return None
 
+    def _extract_one_fallback(
+        self,
+        html_content: str,
+        selector: str,
+        attribute: Optional[str],
+    ) -> Optional[str]:
+        """extract_one() trying each member of a selector group in order."""
+        try:
+            compiled_group = _compile_group(sys.intern(selector))
+            if compiled_group is None:
+                return None
+
+            tree = get_tree(html_content)
+            for compiled in compiled_group:
+                elements = compiled(tree)
+                if elements:
+                    value = self._extract_value(elements[0], attribute)
+                    if value:
+                        return value
+
+            return None
+
+        except Exception:
+            return None
+
     def extract_all(
         self,
         html_content: str,
@@ -53,17 +403,29 @@ class CSSExtractor(BaseExtractor):
         Extract all matching elements.
 
         Args:
-            html_content: HTML string to parse
+            html_content: HTML string to parse (or an already-parsed lxml tree)
             selector: CSS selector
             attribute: Element attribute to extract (None = text content)
 
         Returns:
             List of extracted values
         """
+        if self._use_lexbor(html_content):
+            return self._extract_all_lexbor(html_content, selector, attribute)
+
         try:
-            tree = html.fromstring(html_content)
-            css_selector = CSSSelector(selector)
-            elements = css_selector(tree)
+            if attribute:
+                compiled_attr = _compile_attribute(sys.intern(selector), attribute, False)
+                if compiled_attr is not None:
+                    values = (value.strip() for value in compiled_attr(get_tree(html_content)))
+                    return [value for value in values if value]
+
+            compiled = _compile(selector)
+            if compiled is None:
+                return []
+
+            tree = get_tree(html_content)
+            elements = compiled(tree)
 
             results = []
             for element in elements:
@@ -76,35 +438,203 @@ class CSSExtractor(BaseExtractor):
         except Exception:
             return []
 
+    def extract_many(
+        self,
+        html_content: str,
+        selectors: Dict[str, str],
+        attributes: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, List[str]]:
+        """
+        Extract all matches for several selectors from one document.
+
+        Equivalent to calling extract_all() per selector, but the document
+        is parsed once and every compiled selector runs against that tree.
+
+        Args:
+            html_content: HTML string to parse (or an already-parsed lxml tree)
+            selectors: CSS selectors keyed by field name
+            attributes: Attribute to extract per field name (fields not
+                listed extract text content)
+
+        Returns:
+            Dict mapping each field name to its values in document order
+        """
+        attributes = attributes or {}
+
+        if self._use_lexbor(html_content):
+            try:
+                parser = LexborHTMLParser(html_content)
+            except Exception:
+                return {key: [] for key in selectors}
+            return {
+                key: self._lexbor_values(parser, selector, attributes.get(key))
+                for key, selector in selectors.items()
+            }
+
+        try:
+            tree = get_tree(html_content)
+        except Exception:
+            return {key: [] for key in selectors}
+
+        return {
+            key: self.extract_all(tree, selector, attributes.get(key))
+            for key, selector in selectors.items()
+        }
+
+    def extract_columns(
+        self,
+        html_content: str,
+        container_selector: str,
+        columns: List[str],
+        attribute: Optional[str] = None,
+    ) -> Dict[str, List[str]]:
+        """
+        Extract several class-named columns in a single tree walk.
+
+        Equivalent to calling extract_all() with "<container> .<column>" for
+        each column, but the document is traversed once and cells are
+        bucketed by class. Always evaluated with lxml.
+
+        Args:
+            html_content: HTML string to parse (or an already-parsed lxml tree)
+            container_selector: CSS selector for the element holding the rows
+            columns: Class names identifying each column's cells
+            attribute: Element attribute to extract (None = text content)
+
+        Returns:
+            Dict mapping each column to its values in document order
+        """
+        results: Dict[str, List[str]] = {column: [] for column in columns}
+        if not columns:
+            return results
+
+        try:
+            compiled = _compile_columns(sys.intern(container_selector), tuple(columns))
+            if compiled is None:
+                return results
+
+            tree = get_tree(html_content)
+            for element in compiled(tree):
+                value = self._extract_value(element, attribute)
+                if not value:
+                    continue
+                for column in element.get("class", "").split():
+                    if column in results:
+                        results[column].append(value)
+
+            return results
+
+        except Exception:
+            return {column: [] for column in columns}
+
     def _extract_value(self, element, attribute: Optional[str]) -> Optional[str]:
         """Extract value from an element."""
         if attribute:
             value = element.get(attribute)
+        elif self.text_strategy == "leaf_only":
+            value = (element.text or "") + "".join(child.tail or "" for child in element)
+        elif self.text_strategy == "auto" and len(element) == 0:
+            # Leaf element: its own text is all the text there is
+            value = element.text
         else:
-            # Get text content
             value = element.text_content()
 
         if value:
             return value.strip()
         return None
 
+    def _use_lexbor(self, html_content) -> bool:
+        """Whether to use selectolax (lxml trees always go through lxml)."""
+        return self.backend == "selectolax" and not isinstance(html_content, etree._Element)
+
+    def _extract_one_lexbor(
+        self,
+        html_content: str,
+        selector: str,
+        attribute: Optional[str],
+    ) -> Optional[str]:
+        """extract_one() for the selectolax backend."""
+        try:
+            node = LexborHTMLParser(html_content).css_first(selector)
+            if node is None:
+                return None
+            return self._extract_lexbor_value(node, attribute)
+        except Exception:
+            return None
+
+    def _extract_all_lexbor(
+        self,
+        html_content: str,
+        selector: str,
+        attribute: Optional[str],
+    ) -> List[str]:
+        """extract_all() for the selectolax backend."""
+        try:
+            parser = LexborHTMLParser(html_content)
+        except Exception:
+            return []
+        return self._lexbor_values(parser, selector, attribute)
+
+    def _lexbor_values(self, parser, selector: str, attribute: Optional[str]) -> List[str]:
+        """Values of every node matching a selector in a parsed Lexbor document."""
+        try:
+            results = []
+            for node in parser.css(selector):
+                value = self._extract_lexbor_value(node, attribute)
+                if value:
+                    results.append(value)
+            return results
+        except Exception:
+            return []
+
+    def _extract_lexbor_value(self, node, attribute: Optional[str]) -> Optional[str]:
+        """Extract value from a selectolax node."""
+        if attribute:
+            value = node.attributes.get(attribute)
+        else:
+            value = node.text(deep=self.text_strategy != "leaf_only")
+
+        if value:
+            return value.strip()
+        return None
+
     def exists(self, html_content: str, selector: str) -> bool:
         """Check if selector matches any elements."""
+        if self._use_lexbor(html_content):
+            try:
+                return LexborHTMLParser(html_content).css_first(selector) is not None
+            except Exception:
+                return False
+
         try:
-            tree = html.fromstring(html_content)
-            css_selector = CSSSelector(selector)
-            elements = css_selector(tree)
-            return len(elements) > 0
+            tag = _bare_tag(selector)
+            if tag is not None:
+                return next(get_tree(html_content).iter(tag), None) is not None
+
+            compiled = _compile_wrapped(sys.intern(selector), _EXISTS_TEMPLATE)
+            if compiled is None:
+                return False
+
+            tree = get_tree(html_content)
+            return bool(compiled(tree))
         except Exception:
             return False
 
     def count(self, html_content: str, selector: str) -> int:
         """Count matching elements."""
+        if self._use_lexbor(html_content):
+            try:
+                return len(LexborHTMLParser(html_content).css(selector))
+            except Exception:
+                return 0
+
         try:
-            tree = html.fromstring(html_content)
-            css_selector = CSSSelector(selector)
-            elements = css_selector(tree)
-            return len(elements)
+            compiled = _compile_wrapped(sys.intern(selector), _COUNT_TEMPLATE)
+            if compiled is None:
+                return 0
+
+            tree = get_tree(html_content)
+            return int(compiled(tree))
         except Exception:
             return 0
 
@@ -112,6 +642,13 @@ class CSSExtractor(BaseExtractor):
 class MetaExtractor:
     """Extract meta tag content."""
 
+    # Lookups are compiled once; the meta name is bound as an XPath variable
+    # per call instead of being formatted into a new selector string.
+    _NAME_XPATH = etree.XPath("//meta[@name=$name]/@content")
+    _PROPERTY_XPATH = etree.XPath("//meta[@property=$name]/@content")
+    _ITEMPROP_XPATH = etree.XPath("//*[@itemprop=$name]/@content")
+    _ALL_META_XPATH = etree.XPath("//meta[(@name or @property) and @content]")
+
     def extract(self, html_content: str, name: str) -> Optional[str]:
         """
         Extract meta tag content by name or property.
@@ -123,38 +660,30 @@ class MetaExtractor:
         Returns:
             Content value or None
         """
-        css = CSSExtractor()
-
-        # Try meta name
-        value = css.extract_one(html_content, f'meta[name="{name}"]', "content")
-        if value:
-            return value
-
-        # Try meta property (Open Graph)
-        value = css.extract_one(html_content, f'meta[property="{name}"]', "content")
-        if value:
-            return value
+        try:
+            tree = get_tree(html_content)
+        except Exception:
+            return None
 
-        # Try itemprop
-        value = css.extract_one(html_content, f'[itemprop="{name}"]', "content")
-        if value:
-            return value
+        # Try meta name, then meta property (Open Graph), then itemprop
+        for lookup in (self._NAME_XPATH, self._PROPERTY_XPATH, self._ITEMPROP_XPATH):
+            values = lookup(tree, name=name)
+            if values:
+                value = values[0].strip()
+                if value:
+                    return value
 
         return None
 
     def extract_all_meta(self, html_content: str) -> dict:
         """Extract all meta tags as a dictionary."""
         try:
-            tree = html.fromstring(html_content)
-            meta_tags = tree.cssselect("meta")
-
-            result = {}
-            for meta in meta_tags:
-                name = meta.get("name") or meta.get("property")
-                content = meta.get("content")
-                if name and content:
-                    result[name] = content
-
-            return result
+            tree = get_tree(html_content)
+            # name wins over property on the same tag; later tags overwrite earlier
+            pairs = (
+                (meta.get("name") or meta.get("property"), meta.get("content"))
+                for meta in self._ALL_META_XPATH(tree)
+            )
+            return {name: content for name, content in pairs if name and content}
         except Exception:
             return {}
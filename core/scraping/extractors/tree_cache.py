@@ -0,0 +1,97 @@
+"""Shared cache of parsed HTML trees.
+
+Scrapers usually run several selectors against the same page, and the
+extractors are stateless, so each call used to re-parse the document.
+Trees are cached by HTML content so identical documents share one parse
+across CSSExtractor, XPathExtractor and MetaExtractor.
+
+Bytes are parsed without a decode step. Undeclared bytes are read as
+UTF-8; a <meta charset> or XML encoding declaration still takes effect.
+
+Trees are parsed with lxml's default options. XPathExtractor runs
+user-written rules against the same trees, so //comment(), //p/text()
+and id('main') must see the document as written.
+
+Cached trees are shared between callers and must be treated as read-only.
+Callers that already hold a parsed tree can pass it anywhere HTML is
+expected; it is used as-is.
+"""
+
+import codecs
+import re
+import threading
+from functools import lru_cache
+from typing import Tuple, Union
+
+from lxml import etree, html
+
+# Number of distinct documents kept parsed at once
+TREE_CACHE_SIZE = 64
+
+# Anything the extractors accept as a document
+HTMLInput = Union[str, bytes, etree._Element]
+
+# lxml.html's parser class keeps HtmlElement results, so text_content() works.
+# lxml serializes parses that share a parser object, so each thread gets its
+# own pair: the default parser and one for undeclared bytes. libxml2 reads
+# undeclared bytes as Latin-1; fetched pages are almost always UTF-8.
+_local = threading.local()
+
+# Encoding declarations libxml2 honours, looked for near the top of the document
+_DECLARED_ENCODING_RE = re.compile(rb"<meta[^>]+charset|<\?xml[^>]+encoding", re.IGNORECASE)
+_DECLARATION_SCAN_BYTES = 1024
+_UTF16_BOMS = (codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)
+
+
+@lru_cache(maxsize=TREE_CACHE_SIZE)
+def _parse(html_content: Union[str, bytes]) -> html.HtmlElement:
+    """Parse HTML into an lxml tree (cached by content)."""
+    return html.fromstring(html_content, parser=_parser_for(html_content))
+
+
+def _parsers() -> Tuple[html.HTMLParser, html.HTMLParser]:
+    """This thread's (default, UTF-8) parsers, created on first use."""
+    parsers = getattr(_local, "parsers", None)
+    if parsers is None:
+        parsers = _local.parsers = (
+            html.HTMLParser(),
+            html.HTMLParser(encoding="utf-8"),
+        )
+    return parsers
+
+
+def _parser_for(html_content: Union[str, bytes]) -> html.HTMLParser:
+    """Pick the parser: bytes with no declared encoding are read as UTF-8."""
+    default_parser, utf8_parser = _parsers()
+    if isinstance(html_content, bytes) and not html_content.startswith(_UTF16_BOMS):
+        if not _DECLARED_ENCODING_RE.search(html_content, 0, _DECLARATION_SCAN_BYTES):
+            return utf8_parser
+    return default_parser
+
+
+def get_tree(html_content: HTMLInput) -> etree._Element:
+    """
+    Get the parsed tree for a document, reusing it for repeated content.
+
+    Args:
+        html_content: HTML string/bytes, or an already-parsed lxml tree
+
+    Returns:
+        Root element of the parsed document
+
+    Raises:
+        lxml.etree.ParserError: If the content is empty or unparseable
+    """
+    if isinstance(html_content, etree._Element):
+        return html_content
+    return _parse(html_content)
+
+
+def cache_info():
+    """Hit/miss statistics for the tree cache."""
+    return _parse.cache_info()
+
+
+def clear_cache() -> None:
+    """Drop all cached trees (e.g. between batches in long-running jobs)."""
+    _parse.cache_clear()
@@ -1,21 +1,86 @@
 """Vision-based extractor using OCR and image analysis."""
 
+import importlib.util
 import io
+import queue
 import re
-from typing import Optional, List, Dict, Any
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Iterator, Optional, List, Dict, Any
 from dataclasses import dataclass, field
 
-try:
-    from PIL import Image
-    HAS_PIL = True
-except ImportError:
-    HAS_PIL = False
+# The OCR stack is slow to import and only needed once a VisionExtractor is
+# built, so availability is checked without importing it here. The modules
+# are bound by _import_ocr_modules() on first use.
+HAS_PIL = importlib.util.find_spec("PIL") is not None
+HAS_TESSERACT = importlib.util.find_spec("pytesseract") is not None
+# Optional in-process engine; without it every OCR call starts a tesseract process
+HAS_TESSEROCR = importlib.util.find_spec("tesserocr") is not None
 
-try:
-    import pytesseract
-    HAS_TESSERACT = True
-except ImportError:
-    HAS_TESSERACT = False
+Image = None
+ImageFilter = None
+pytesseract = None
+
+# Binary threshold as a grayscale lookup table (applied in C by Image.point)
+_THRESHOLD_LUT = [255 if value > 128 else 0 for value in range(256)]
+
+
+def _import_ocr_modules() -> None:
+    """Import Pillow and pytesseract into this module's globals."""
+    global Image, ImageFilter, pytesseract
+    if pytesseract is None:
+        from PIL import Image as _Image, ImageFilter as _ImageFilter
+        import pytesseract as _pytesseract
+        Image, ImageFilter, pytesseract = _Image, _ImageFilter, _pytesseract
+
+
+class _TesseractAPIPool:
+    """
+    Reusable in-process Tesseract engines (tesserocr), pooled per language.
+
+    A PyTessBaseAPI loads its language data once but is not thread-safe,
+    so each call checks one out for exclusive use and returns it after.
+    The pool grows to the number of concurrent callers.
+
+    Creating an engine fails when tessdata is missing or mismatched (or
+    TESSDATA_PREFIX is wrong). acquire() then yields None so callers can
+    use pytesseract instead, and the language isn't retried.
+    """
+
+    def __init__(self):
+        self._pools: Dict[str, "queue.SimpleQueue"] = {}
+        self._unavailable: set = set()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def acquire(self, lang: str) -> Iterator[Optional[Any]]:
+        with self._lock:
+            if lang in self._unavailable:
+                pool = None
+            else:
+                pool = self._pools.setdefault(lang, queue.SimpleQueue())
+        if pool is None:
+            yield None
+            return
+        try:
+            api = pool.get_nowait()
+        except queue.Empty:
+            try:
+                import tesserocr
+                api = tesserocr.PyTessBaseAPI(lang=lang)
+            except Exception:
+                with self._lock:
+                    self._unavailable.add(lang)
+                yield None
+                return
+        try:
+            yield api
+        finally:
+            pool.put(api)
+
+
+_api_pool = _TesseractAPIPool()
 
 
 @dataclass
@@ -29,9 +94,9 @@ class VisionExtractionResult:
     regions: List["TextRegion"] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TextRegion:
-    """A region of text found in an image."""
+    """A region of text found in an image (one per OCR box, so kept compact)."""
     text: str
     x: int
     y: int
@@ -67,20 +132,55 @@ class VisionExtractor:
                 "Install with: pip install pytesseract\n"
                 "Also install Tesseract OCR: https://github.com/tesseract-ocr/tesseract"
             )
+        _import_ocr_modules()
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def is_available() -> bool:
-        """Check if vision extraction is available."""
+        """
+        Check if vision extraction is available.
+
+        Probing Tesseract starts a subprocess, so the answer is computed
+        once per process; call is_available.cache_clear() after installing
+        Tesseract to re-check.
+        """
         if not HAS_PIL or not HAS_TESSERACT:
             return False
 
         # Check if Tesseract binary is accessible
         try:
+            _import_ocr_modules()
             pytesseract.get_tesseract_version()
             return True
         except Exception:
             return False
 
+    def _ocr(self, image, lang: str, config: str = "") -> VisionExtractionResult:
+        """Run OCR on an already-decoded PIL image."""
+        # Run OCR (tesserocr takes no CLI config string, so those calls use pytesseract)
+        text = None
+        if HAS_TESSEROCR and not config:
+            with _api_pool.acquire(lang) as api:
+                if api is not None:
+                    api.SetImage(image)
+                    text = api.GetUTF8Text()
+                    avg_confidence = api.MeanTextConf()
+
+        if text is None:
+            # pytesseract: config given, no tesserocr, or no engine for this lang
+            text = pytesseract.image_to_string(image, lang=lang, config=config)
+
+            # Get confidence data
+            data = pytesseract.image_to_data(image, lang=lang, output_type=pytesseract.Output.DICT)
+            confidences = [c for c in data['conf'] if c != -1]
+            avg_confidence = sum(confidences) / len(confidences) if confidences else 0
+
+        return VisionExtractionResult(
+            success=True,
+            text=text.strip(),
+            confidence=avg_confidence / 100,  # Normalize to 0-1
+        )
+
     def extract_text(
         self,
         image_data: bytes,
@@ -109,19 +209,7 @@ class VisionExtractor:
                 background.paste(image, mask=image.split()[-1] if image.mode == 'RGBA' else None)
                 image = background
 
-            # Run OCR
-            text = pytesseract.image_to_string(image, lang=lang, config=config)
-
-            # Get confidence data
-            data = pytesseract.image_to_data(image, lang=lang, output_type=pytesseract.Output.DICT)
-            confidences = [c for c in data['conf'] if c != -1]
-            avg_confidence = sum(confidences) / len(confidences) if confidences else 0
-
-            return VisionExtractionResult(
-                success=True,
-                text=text.strip(),
-                confidence=avg_confidence / 100,  # Normalize to 0-1
-            )
+            return self._ocr(image, lang, config)
 
         except Exception as e:
             return VisionExtractionResult(
@@ -386,25 +474,16 @@ class VisionExtractor:
 
             # Apply preprocessing
             if threshold:
-                # Simple threshold - pixels above 128 become white, below become black
-                image = image.point(lambda x: 255 if x > 128 else 0, '1')
-                image = image.convert('L')
+                # Pixels above 128 become white, the rest black; a lookup
+                # table keeps the image in 'L' mode (no 1-bit round trip)
+                image = image.point(_THRESHOLD_LUT)
 
             if denoise:
                 # Basic median filter for noise reduction
-                try:
-                    from PIL import ImageFilter
-                    image = image.filter(ImageFilter.MedianFilter(size=3))
-                except Exception:
-                    pass  # Skip if filter unavailable
-
-            # Convert back to bytes
-            buffer = io.BytesIO()
-            image.save(buffer, format='PNG')
-            processed_bytes = buffer.getvalue()
+                image = image.filter(ImageFilter.MedianFilter(size=3))
 
-            # Run OCR on preprocessed image
-            return self.extract_text(processed_bytes, lang)
+            # Run OCR on the preprocessed image directly (no PNG re-encode)
+            return self._ocr(image, lang)
 
         except Exception as e:
             return VisionExtractionResult(
@@ -0,0 +1,64 @@
+"""Shared cache of compiled XPath expressions.
+
+XPathExtractor compiles the expressions it is given, and CSSExtractor
+compiles the XPath its selectors translate to. Both go through this
+cache, so an expression is compiled by libxml2 once per process no
+matter which extractor asked for it.
+
+Compiled expressions are stateless and may be shared freely, with one
+exception: lxml.cssselect translates :contains() into a call to its
+"__lxml_internal_css" extension functions, and a compiled expression
+only resolves that prefix on the first document it is evaluated on.
+Such expressions are compiled fresh on every call instead.
+"""
+
+from functools import lru_cache
+from typing import Optional
+
+from lxml import etree
+
+# Number of distinct expressions kept compiled at once
+XPATH_CACHE_SIZE = 1024
+
+# Function prefix lxml.cssselect uses for :contains() (never cached, see above)
+_CSS_EXTENSION_PREFIX = "__lxml_internal_css:"
+
+
+def compile_xpath(expression: str, smart_strings: bool = True) -> Optional[etree.XPath]:
+    """
+    Compile an XPath expression, once per expression string where possible.
+
+    Invalid expressions are cached as None so repeated bad input doesn't
+    go through the XPath parser again.
+
+    Args:
+        expression: XPath expression
+        smart_strings: Passed to etree.XPath (False returns plain str results)
+
+    Returns:
+        Compiled XPath, or None if the expression is invalid
+    """
+    if _CSS_EXTENSION_PREFIX in expression:
+        return _compile(expression, smart_strings)
+    return _compile_cached(expression, smart_strings)
+
+
+def _compile(expression: str, smart_strings: bool) -> Optional[etree.XPath]:
+    """Compile an expression (None if invalid)."""
+    try:
+        return etree.XPath(expression, smart_strings=smart_strings)
+    except etree.XPathError:
+        return None
+
+
+_compile_cached = lru_cache(maxsize=XPATH_CACHE_SIZE)(_compile)
+
+
+def cache_info():
+    """Hit/miss statistics for the compiled-XPath cache."""
+    return _compile_cached.cache_info()
+
+
+def clear_cache() -> None:
+    """Drop all compiled expressions."""
+    _compile_cached.cache_clear()
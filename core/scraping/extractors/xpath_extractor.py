@@ -1,9 +1,19 @@
 """XPath-based extraction."""
 
 from typing import Optional, List
-from lxml import html
+from lxml import etree
 
 from core.scraping.extractors.base import BaseExtractor
+from core.scraping.extractors.tree_cache import get_tree
+from core.scraping.extractors.xpath_cache import compile_xpath
+
+
+def _evaluate(tree: etree._Element, xpath: str) -> list:
+    """Evaluate a (compiled) XPath expression against a tree."""
+    compiled = compile_xpath(xpath)
+    if compiled is None:
+        raise etree.XPathSyntaxError(f"Invalid XPath: {xpath}")
+    return compiled(tree)
 
 
 class XPathExtractor(BaseExtractor):
@@ -21,7 +31,7 @@ class XPathExtractor(BaseExtractor):
         Extract the first matching element.
 
         Args:
-            html_content: HTML string to parse
+            html_content: HTML string to parse (or an already-parsed lxml tree)
             xpath: XPath expression
             attribute: Element attribute to extract (None = text content)
 
@@ -29,8 +39,8 @@ class XPathExtractor(BaseExtractor):
             Extracted value or None
         """
         try:
-            tree = html.fromstring(html_content)
-            elements = tree.xpath(xpath)
+            tree = get_tree(html_content)
+            elements = _evaluate(tree, xpath)
 
             if not elements:
                 return None
@@ -51,7 +61,7 @@ class XPathExtractor(BaseExtractor):
         Extract all matching elements.
 
         Args:
-            html_content: HTML string to parse
+            html_content: HTML string to parse (or an already-parsed lxml tree)
             xpath: XPath expression
             attribute: Element attribute to extract (None = text content)
 
@@ -59,8 +69,8 @@ class XPathExtractor(BaseExtractor):
             List of extracted values
         """
         try:
-            tree = html.fromstring(html_content)
-            elements = tree.xpath(xpath)
+            tree = get_tree(html_content)
+            elements = _evaluate(tree, xpath)
 
             results = []
             for element in elements:
@@ -92,8 +102,8 @@ class XPathExtractor(BaseExtractor):
     def exists(self, html_content: str, xpath: str) -> bool:
         """Check if XPath matches any elements."""
         try:
-            tree = html.fromstring(html_content)
-            elements = tree.xpath(xpath)
+            tree = get_tree(html_content)
+            elements = _evaluate(tree, xpath)
             return len(elements) > 0
         except Exception:
             return False
@@ -101,8 +111,8 @@ class XPathExtractor(BaseExtractor):
     def count(self, html_content: str, xpath: str) -> int:
         """Count matching elements."""
         try:
-            tree = html.fromstring(html_content)
-            elements = tree.xpath(xpath)
+            tree = get_tree(html_content)
+            elements = _evaluate(tree, xpath)
             return len(elements)
         except Exception:
             return 0
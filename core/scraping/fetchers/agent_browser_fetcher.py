@@ -22,8 +22,20 @@ from playwright.async_api import Page, async_playwright
 
 import config
 
+# Roles that get element refs in accessibility snapshots
+_INTERACTIVE_ROLES = frozenset({
+    "button", "link", "textbox", "checkbox", "radio", "combobox",
+    "listbox", "option", "menuitem", "tab", "switch", "slider",
+    "spinbutton", "searchbox", "menubar", "menu", "menuitemcheckbox",
+    "menuitemradio", "treeitem", "gridcell", "row", "cell", "img",
+})
 
-@dataclass
+# Snapshot line body: role, optional quoted name, rest (e.g. heading "Title" [level=1])
+_ROLE_LINE_RE = re.compile(r'^(\w+)(?:\s+"([^"]*)")?(.*)$')
+_REF_RE = re.compile(r"@e\d+")
+
+
+@dataclass(slots=True, frozen=True)
 class AgentBrowserResult:
     """Result from an Agent-browser fetch operation."""
 
@@ -142,14 +154,6 @@ class AgentBrowserFetcher:
         if not snapshot:
             return ""
 
-        # Interactive roles that get refs
-        interactive_roles = {
-            "button", "link", "textbox", "checkbox", "radio", "combobox",
-            "listbox", "option", "menuitem", "tab", "switch", "slider",
-            "spinbutton", "searchbox", "menubar", "menu", "menuitemcheckbox",
-            "menuitemradio", "treeitem", "gridcell", "row", "cell", "img",
-        }
-
         output_lines = []
         lines = snapshot.split("\n")
 
@@ -159,14 +163,14 @@ class AgentBrowserFetcher:
 
             # Parse role and name from lines like: heading "Title" [level=1]
             # or: link "Learn more":
-            role_match = re.match(r'^(\w+)(?:\s+"([^"]*)")?(.*)$', stripped)
+            role_match = _ROLE_LINE_RE.match(stripped)
 
             if role_match:
                 role = role_match.group(1).lower()
                 name = role_match.group(2) or ""
                 rest = role_match.group(3) or ""
 
-                if role in interactive_roles:
+                if role in _INTERACTIVE_ROLES:
                     self._ref_counter += 1
                     ref_id = f"@e{self._ref_counter}"
 
@@ -491,7 +495,7 @@ class AgentBrowserFetcher:
                 # Filter to only lines with refs
                 lines = tree_text.split("\n")
                 interactive_lines = [
-                    line for line in lines if re.search(r"@e\d+", line)
+                    line for line in lines if _REF_RE.search(line)
                 ]
                 return "\n".join(interactive_lines)
 
@@ -9,7 +9,7 @@ from dataclasses import dataclass
 from typing import Optional, Dict, Any
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BaseFetchResult:
     """
     Base result from any fetch operation.
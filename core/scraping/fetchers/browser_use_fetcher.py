@@ -25,7 +25,7 @@ except ImportError:
     HAS_BROWSER_USE = False
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BrowserUseResult:
     """Result from a Browser-use fetch operation."""
 
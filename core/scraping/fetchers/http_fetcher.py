@@ -6,12 +6,19 @@ from typing import Optional, Dict, Any
 from dataclasses import dataclass
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
 
 import config
 
+# One connection pool shared by every fetcher's session, so keep-alive
+# connections (and their TLS handshakes) are reused across fetcher instances.
+# Cookies stay per session. Retries are handled by fetch() itself.
+HTTP_POOL_SIZE = 50
+_ADAPTER = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE, max_retries=0)
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class FetchResult:
     """Result from a fetch operation."""
 
@@ -23,7 +30,7 @@ class FetchResult:
     response_time_ms: int = 0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HeadResult:
     """Result from a HEAD request operation."""
 
@@ -40,6 +47,8 @@ class HTTPFetcher:
     def __init__(self):
         self.user_agents = config.USER_AGENTS
         self.session = requests.Session()
+        self.session.mount("http://", _ADAPTER)
+        self.session.mount("https://", _ADAPTER)
 
     def get_random_user_agent(self) -> str:
         """Get a random user agent."""
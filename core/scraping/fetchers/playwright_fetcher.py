@@ -23,7 +23,7 @@ _thread_local = threading.local()
 _use_subprocess_fallback = False
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PlaywrightResult:
     """Result from a Playwright fetch operation."""
 
@@ -17,7 +17,7 @@ from typing import Optional
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SubprocessPlaywrightResult:
     """Result from subprocess Playwright fetch."""
     success: bool
@@ -25,7 +25,7 @@ import config
 _thread_local = threading.local()
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PuppeteerResult:
     """Result from a Puppeteer fetch operation."""
 
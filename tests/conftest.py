@@ -2,6 +2,9 @@
 
 import os
 import sys
+from functools import lru_cache
+from types import MappingProxyType
+
 import pytest
 from pathlib import Path
 
@@ -14,7 +17,7 @@ sys.path.insert(0, str(PROJECT_ROOT))
 # HTML Fixtures
 # ============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def simple_html():
     """Basic HTML page for testing - meets minimum content length."""
     # Padding to meet minimum content requirements (500 chars, 50 words)
@@ -40,7 +43,7 @@ def simple_html():
     """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def complex_html():
     """Complex HTML with nested structures."""
     return """
@@ -86,7 +89,7 @@ def complex_html():
     """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def malformed_html():
     """Malformed HTML for robustness testing."""
     return """
@@ -103,13 +106,13 @@ def malformed_html():
     """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def empty_html():
     """Empty/minimal HTML."""
     return "<html><body></body></html>"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def js_heavy_html():
     """JavaScript-heavy SPA page."""
     return """
@@ -127,14 +130,26 @@ def js_heavy_html():
     """
 
 
+@pytest.fixture(scope="session")
+def simple_tree(simple_html):
+    """simple_html parsed once for the session (read-only)."""
+    from core.scraping.extractors.tree_cache import get_tree
+    return get_tree(simple_html)
+
+
+@pytest.fixture(scope="session")
+def complex_tree(complex_html):
+    """complex_html parsed once for the session (read-only)."""
+    from core.scraping.extractors.tree_cache import get_tree
+    return get_tree(complex_html)
+
+
 # ============================================================================
 # Poison Pill Fixtures
 # ============================================================================
 
-def _pad_content(base_html, padding_text=None):
-    """Add padding to HTML to meet minimum content requirements."""
-    if padding_text is None:
-        padding_text = """
+# Built once; every padded fixture and pad_html() call inserts this paragraph
+_PADDING_PARAGRAPH = """
         <p>This is additional content to ensure we meet the minimum word count requirement.
         The poison pill detector requires at least 50 words and 500 characters before it will
         check for other types of issues. This paragraph provides that padding while still
@@ -142,6 +157,10 @@ def _pad_content(base_html, padding_text=None):
         Adding more content here to ensure we definitely exceed the minimum threshold of
         five hundred characters that the detector uses to identify content too short errors.</p>
         """
+
+
+def _pad_content(base_html, padding_text=_PADDING_PARAGRAPH):
+    """Add padding to HTML to meet minimum content requirements."""
     # Insert before closing body tag
     return base_html.replace("</body>", padding_text + "</body>")
 
@@ -250,6 +269,23 @@ def login_required_html():
     return _pad_content(base)
 
 
+# ============================================================================
+# Extractor Fixtures
+# ============================================================================
+
+@pytest.fixture(scope="session")
+def css_extractor():
+    """
+    Default CSSExtractor shared by the whole session.
+
+    Extractors hold only the configuration passed to __init__; compiled
+    selectors and parsed trees live in module-level caches, so one
+    instance is safe to reuse across tests.
+    """
+    from core.scraping.extractors.css_extractor import CSSExtractor
+    return CSSExtractor()
+
+
 # ============================================================================
 # Mock Objects
 # ============================================================================
@@ -497,22 +533,36 @@ BOOKS_TO_SCRAPE_CATALOG_HTML = """
 """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def books_to_scrape_book():
     """Realistic book detail page HTML from Books to Scrape sandbox."""
     return BOOKS_TO_SCRAPE_BOOK_HTML
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def books_to_scrape_catalog():
     """Realistic catalog listing page HTML from Books to Scrape sandbox."""
     return BOOKS_TO_SCRAPE_CATALOG_HTML
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def books_to_scrape_book_tree(books_to_scrape_book):
+    """Book detail page parsed once for the session (read-only)."""
+    from core.scraping.extractors.tree_cache import get_tree
+    return get_tree(books_to_scrape_book)
+
+
+@pytest.fixture(scope="session")
+def books_to_scrape_catalog_tree(books_to_scrape_catalog):
+    """Catalog listing page parsed once for the session (read-only)."""
+    from core.scraping.extractors.tree_cache import get_tree
+    return get_tree(books_to_scrape_catalog)
+
+
+@pytest.fixture(scope="session")
 def books_to_scrape_selectors():
-    """Common CSS selectors for Books to Scrape site."""
-    return {
+    """Common CSS selectors for Books to Scrape site (shared, read-only)."""
+    return MappingProxyType({
         # Book detail page selectors
         "title": "article.product_page h1",
         "price": "p.price_color",
@@ -528,18 +578,29 @@ def books_to_scrape_selectors():
         "book_link": "article.product_pod .image_container a",
         "pagination": "ul.pager li.current",
         "next_page": "ul.pager li.next a",
-    }
+    })
 
 
 # ============================================================================
 # Utility Functions for Tests
 # ============================================================================
 
+@lru_cache(maxsize=256)
 def pad_html(base_html: str) -> str:
     """
     Add padding to HTML to meet minimum content requirements.
 
     Use this helper for inline test HTML that needs to pass the
     poison pill detector's content length check (500 chars, 50 words).
+    Results are cached, so parametrized tests pad each literal once.
     """
     return _pad_content(base_html)
+
+
+def as_bytes(html: str) -> bytes:
+    """
+    Encode test HTML as UTF-8 bytes, as a fetcher would return it.
+
+    The extractors parse bytes directly; undeclared bytes are read as UTF-8.
+    """
+    return html.encode("utf-8")
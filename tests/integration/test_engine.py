@@ -43,6 +43,16 @@ class TestScrapingEngineInit:
         assert engine.css_extractor is not None
         assert engine.xpath_extractor is not None
 
+    def test_css_backend_from_config(self, monkeypatch):
+        """The CSS extractor backend follows config.CSS_BACKEND."""
+        import config
+        from core.scraping.extractors.css_extractor import HAS_SELECTOLAX
+
+        assert ScrapingEngine().css_extractor.backend == config.CSS_BACKEND
+        if HAS_SELECTOLAX:
+            monkeypatch.setattr(config, "CSS_BACKEND", "selectolax")
+            assert ScrapingEngine().css_extractor.backend == "selectolax"
+
     def test_poison_detector_initialized(self):
         """Engine should have poison detector ready."""
         engine = ScrapingEngine()
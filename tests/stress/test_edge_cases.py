@@ -15,7 +15,7 @@ class TestLargeContent:
         from core.scraping.engine import ScrapingEngine
         return ScrapingEngine()
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def detector(self):
         from core.poison_pills.detector import PoisonPillDetector
         return PoisonPillDetector()
@@ -82,12 +82,7 @@ class TestLargeContent:
 class TestMalformedContent:
     """Tests for handling malformed/broken content."""
 
-    @pytest.fixture
-    def css_extractor(self):
-        from core.scraping.extractors.css_extractor import CSSExtractor
-        return CSSExtractor()
-
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def detector(self):
         from core.poison_pills.detector import PoisonPillDetector
         return PoisonPillDetector()
@@ -145,7 +140,7 @@ class TestMalformedContent:
 class TestConcurrency:
     """Tests for concurrent/parallel operations."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def detector(self):
         from core.poison_pills.detector import PoisonPillDetector
         return PoisonPillDetector()
@@ -316,11 +311,6 @@ class TestBoundaryConditions:
 class TestSpecialCharacters:
     """Tests for special character handling."""
 
-    @pytest.fixture
-    def css_extractor(self):
-        from core.scraping.extractors.css_extractor import CSSExtractor
-        return CSSExtractor()
-
     def test_quotes_in_content(self, css_extractor):
         """Handle quotes in content."""
         html = '<html><body><p>He said "Hello" and \'Goodbye\'</p></body></html>'
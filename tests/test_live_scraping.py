@@ -113,7 +113,7 @@ class TestHTTPFetcher:
 class TestCSSExtractor:
     """Test CSS extraction on fetched HTML."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def extractor(self):
         return CSSExtractor()
 
@@ -10,6 +10,7 @@ Tests cover the CSSExtractor using standard CSS selector syntax:
 """
 
 import pytest
+from lxml import html as lxml_html
 from tests.conftest import pad_html
 
 from core.scraping.extractors.css_extractor import CSSExtractor, MetaExtractor
@@ -19,13 +20,13 @@ from core.scraping.extractors.css_extractor import CSSExtractor, MetaExtractor
 # Fixture: Extractor instances
 # ============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def extractor():
     """Create a CSS extractor instance."""
     return CSSExtractor()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def meta_extractor():
     """Create a meta extractor instance."""
     return MetaExtractor()
@@ -35,7 +36,7 @@ def meta_extractor():
 # HTML FIXTURES FOR CSS TESTING
 # ============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def article_html():
     """Realistic article HTML for testing."""
     return """
@@ -100,7 +101,7 @@ def article_html():
     """
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def table_html():
     """Table HTML for testing table selectors."""
     return """
@@ -168,6 +169,18 @@ def nested_html():
     """
 
 
+@pytest.fixture(scope="module")
+def article_tree(article_html):
+    """article_html parsed once for the whole module."""
+    return lxml_html.fromstring(article_html)
+
+
+@pytest.fixture(scope="module")
+def table_tree(table_html):
+    """table_html parsed once for the whole module."""
+    return lxml_html.fromstring(table_html)
+
+
 # ============================================================================
 # BASIC SELECTORS
 # tag, .class, #id - 30 tests
@@ -468,6 +481,17 @@ class TestPseudoClassSelectors:
         results = extractor.extract_all(article_html, selector)
         assert len(results) == expected_count
 
+    # :contains() (lxml extension function)
+    def test_contains_across_documents(self, extractor):
+        """:contains() keeps matching on every document, not just the first one."""
+        for i in range(3):
+            html = f'<div><p>other {i}</p><p>within {i}</p><a href="/{i}">within</a></div>'
+            assert extractor.extract_all(html, "p:contains('within')") == [f"within {i}"]
+            assert extractor.extract_one(html, "p:contains('within')") == f"within {i}"
+            assert extractor.extract_one(html, "a:contains('within')", attribute="href") == f"/{i}"
+            assert extractor.count(html, "p:contains('within')") == 1
+            assert extractor.exists(html, "p:contains('within')") is True
+
 
 # ============================================================================
 # TABLE SELECTORS
@@ -508,6 +532,27 @@ class TestTableSelectors:
         results = extractor.extract_all(table_html, f"tbody .{column_class}")
         assert results == expected_values
 
+    @pytest.mark.parametrize("column_class,expected_values", [
+        ("name", ["Product A", "Product B", "Product C"]),
+        ("price", ["$10.00", "$20.00", "$15.00"]),
+        ("stock", ["In Stock", "Out of Stock", "In Stock"]),
+    ])
+    def test_table_columns_single_walk(self, extractor, table_html, column_class, expected_values):
+        """extract_columns() matches per-column extract_all() results."""
+        columns = extractor.extract_columns(table_html, "tbody", ["name", "price", "stock"])
+        assert columns[column_class] == expected_values
+        assert columns[column_class] == extractor.extract_all(table_html, f"tbody .{column_class}")
+
+    def test_table_columns_missing_column(self, extractor, table_html):
+        """Columns with no matching cells map to empty lists."""
+        columns = extractor.extract_columns(table_html, "tbody", ["name", "sku"])
+        assert columns["sku"] == []
+        assert len(columns["name"]) == 3
+
+    def test_table_columns_invalid_container(self, extractor, table_html):
+        """An invalid container selector yields empty columns, not an error."""
+        assert extractor.extract_columns(table_html, "[[[", ["name"]) == {"name": []}
+
     def test_table_data_attribute(self, extractor, table_html):
         """Extract data attributes from rows."""
         results = extractor.extract_all(table_html, "tbody tr", attribute="data-id")
@@ -558,6 +603,18 @@ class TestMetaExtraction:
         assert "description" in meta
         assert "og:title" in meta
 
+    def test_extract_all_meta_skips_incomplete_tags(self, meta_extractor):
+        """Tags without a key or content are left out; name beats property."""
+        html = """
+        <html><head>
+            <meta charset="utf-8">
+            <meta name="robots">
+            <meta property="og:type" content="">
+            <meta name="author" property="og:author" content="Jane">
+        </head><body></body></html>
+        """
+        assert meta_extractor.extract_all_meta(html) == {"author": "Jane"}
+
     def test_meta_priority(self, meta_extractor):
         """Test that name takes priority over property."""
         html = """
@@ -572,6 +629,57 @@ class TestMetaExtraction:
         result = meta_extractor.extract(html, "author")
         assert result == "Name Author"
 
+    def test_itemprop_fallback(self, meta_extractor):
+        """Fall back to itemprop when no meta name/property matches."""
+        html = """
+        <html>
+        <head><meta itemprop="datePublished" content="2024-02-01"></head>
+        <body><p>Content</p></body>
+        </html>
+        """
+        assert meta_extractor.extract(html, "datePublished") == "2024-02-01"
+
+    def test_name_with_quotes(self, meta_extractor):
+        """Names are bound as XPath variables, so quotes need no escaping."""
+        html = """
+        <html>
+        <head><meta name='it"s' content="Quoted"></head>
+        <body><p>Content</p></body>
+        </html>
+        """
+        assert meta_extractor.extract(html, 'it"s') == "Quoted"
+
+
+# ============================================================================
+# PRE-PARSED TREES
+# Extractors accept an lxml tree in place of an HTML string
+# ============================================================================
+
+class TestPreparsedTrees:
+    """Passing a pre-parsed tree must give the same results as the HTML string."""
+
+    @pytest.mark.parametrize("selector,attribute", [
+        ("thead th", None),
+        ("tbody .price", None),
+        ("tbody tr", "data-id"),
+        ("tbody tr:last-child .name", None),
+        (".nonexistent", None),
+    ])
+    def test_table_tree_matches_string(self, extractor, table_html, table_tree, selector, attribute):
+        assert (extractor.extract_all(table_tree, selector, attribute)
+                == extractor.extract_all(table_html, selector, attribute))
+        assert (extractor.extract_one(table_tree, selector, attribute)
+                == extractor.extract_one(table_html, selector, attribute))
+        assert extractor.count(table_tree, selector) == extractor.count(table_html, selector)
+        assert extractor.exists(table_tree, selector) == extractor.exists(table_html, selector)
+
+    @pytest.mark.parametrize("name", ["author", "description", "og:title", "nonexistent"])
+    def test_meta_tree_matches_string(self, meta_extractor, article_html, article_tree, name):
+        assert meta_extractor.extract(article_tree, name) == meta_extractor.extract(article_html, name)
+
+    def test_all_meta_tree_matches_string(self, meta_extractor, article_html, article_tree):
+        assert meta_extractor.extract_all_meta(article_tree) == meta_extractor.extract_all_meta(article_html)
+
 
 # ============================================================================
 # UTILITY METHODS
@@ -678,6 +786,20 @@ class TestRealWorldPatterns:
         title = extractor.extract_one(article_html, "h1, .post-title, .article-title")
         assert "Article Title Here" in title
 
+    def test_article_extraction_fallback_order(self, article_html):
+        """With group_fallback, the first group member that matches wins."""
+        fallback = CSSExtractor(group_fallback=True)
+        # Document order would pick the h1; fallback order tries .author first
+        assert fallback.extract_one(article_html, ".author, h1") == "John Doe"
+        assert fallback.extract_one(article_html, ".article-title, h1, .post-title") == "Article Title Here"
+        assert fallback.extract_one(article_html, ".missing, .also-missing") is None
+
+    def test_selector_group_commas_in_values(self):
+        """Commas inside attribute values are not group separators."""
+        from core.scraping.extractors.css_extractor import _compile_group
+
+        assert len(_compile_group('[title="a,b"], h1')) == 2
+
     def test_author_extraction_patterns(self, extractor, article_html):
         """Multiple author selector patterns."""
         selectors = [".author", "[rel='author']", ".byline", ".post-author"]
@@ -747,7 +869,7 @@ class TestRealWorldPatterns:
 class TestMultipleClasses:
     """Test selecting elements with multiple classes."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def multi_class_html(self):
         return """
         <html><body>
@@ -13,18 +13,53 @@ from api.middleware.exceptions import (
     format_error_response,
 )
 
+# Every APIError subclass exposed by the exceptions module
+_ERROR_CLASSES = (
+    ValidationError,
+    NotFoundError,
+    ConflictError,
+    ServiceUnavailableError,
+    RateLimitError,
+)
 
-class TestAPIError:
-    """Tests for the base APIError class."""
 
-    def test_default_values(self):
-        """Default values are set correctly."""
-        error = APIError("Something went wrong")
+class TestErrorDefaults:
+    """Default message, code, status and details for each error class."""
+
+    @pytest.mark.parametrize("cls,args,message,code,status,details", [
+        (APIError, ("Something went wrong",), "Something went wrong", "API_ERROR", 500, {}),
+        (ValidationError, ("Invalid input",), "Invalid input", "VALIDATION_ERROR", 400, {}),
+        (NotFoundError, ("Job",), "Job not found", "NOT_FOUND", 404,
+         {"resource": "Job", "identifier": None}),
+        (ConflictError, ("Resource already exists",), "Resource already exists", "CONFLICT", 409, {}),
+        (ServiceUnavailableError, ("Ollama",), "Ollama service is temporarily unavailable",
+         "SERVICE_UNAVAILABLE", 503, {"service": "Ollama"}),
+        (RateLimitError, (), "Rate limit exceeded. Please try again later.",
+         "RATE_LIMIT_EXCEEDED", 429, {}),
+    ], ids=["APIError"] + [cls.__name__ for cls in _ERROR_CLASSES])
+    def test_defaults(self, cls, args, message, code, status, details):
+        """Each error class fills in its own defaults."""
+        error = cls(*args)
+
+        assert error.message == message
+        assert error.code == code
+        assert error.status_code == status
+        assert error.details == details
+
+    @pytest.mark.parametrize("cls,message,details", [
+        (ValidationError, "Email is invalid", {"field": "email", "value": "not-an-email"}),
+        (ConflictError, "Duplicate entry", {"field": "email", "existing_id": 42}),
+    ], ids=["ValidationError", "ConflictError"])
+    def test_with_details(self, cls, message, details):
+        """Errors that take details keep them as given."""
+        error = cls(message, details=details)
+
+        assert error.message == message
+        assert error.details == details
+
 
-        assert error.message == "Something went wrong"
-        assert error.code == "API_ERROR"
-        assert error.status_code == 500
-        assert error.details == {}
+class TestAPIError:
+    """Tests for the base APIError class."""
 
     def test_custom_values(self):
         """Custom values are set correctly."""
@@ -40,6 +75,26 @@ class TestAPIError:
         assert error.status_code == 418
         assert error.details == {"foo": "bar"}
 
+    def test_fields_in_slots(self):
+        """Error fields are slot-backed, leaving the instance dict empty."""
+        error = NotFoundError("Job", 7)
+        assert error.__dict__ == {}
+
+    @pytest.mark.parametrize("error", [
+        APIError("Custom", code="CUSTOM", status_code=418, details={"a": 1}),
+        NotFoundError("Job", 123),
+        RateLimitError(retry_after=30),
+    ], ids=lambda error: type(error).__name__)
+    def test_pickle_round_trip(self, error):
+        """Slot fields survive pickling unchanged."""
+        import pickle
+
+        restored = pickle.loads(pickle.dumps(error))
+        assert type(restored) is type(error)
+        assert str(restored) == str(error)
+        for name in ("message", "code", "status_code", "details"):
+            assert getattr(restored, name) == getattr(error, name)
+
     def test_str_representation(self):
         """str() returns the message."""
         error = APIError("Test message")
@@ -53,44 +108,9 @@ class TestAPIError:
             raise APIError("Test error")
 
 
-class TestValidationError:
-    """Tests for ValidationError."""
-
-    def test_defaults(self):
-        """ValidationError has correct defaults."""
-        error = ValidationError("Invalid input")
-
-        assert error.message == "Invalid input"
-        assert error.code == "VALIDATION_ERROR"
-        assert error.status_code == 400
-        assert error.details == {}
-
-    def test_with_details(self):
-        """ValidationError accepts details."""
-        error = ValidationError(
-            "Email is invalid",
-            details={"field": "email", "value": "not-an-email"},
-        )
-
-        assert error.details == {"field": "email", "value": "not-an-email"}
-
-    def test_is_api_error_subclass(self):
-        """ValidationError is an APIError subclass."""
-        assert issubclass(ValidationError, APIError)
-
-
 class TestNotFoundError:
     """Tests for NotFoundError."""
 
-    def test_without_identifier(self):
-        """NotFoundError message without identifier."""
-        error = NotFoundError("Job")
-
-        assert error.message == "Job not found"
-        assert error.code == "NOT_FOUND"
-        assert error.status_code == 404
-        assert error.details == {"resource": "Job", "identifier": None}
-
     def test_with_identifier(self):
         """NotFoundError message with identifier."""
         error = NotFoundError("Job", 123)
@@ -105,39 +125,9 @@ class TestNotFoundError:
         assert error.message == "User with id 'john@example.com' not found"
 
 
-class TestConflictError:
-    """Tests for ConflictError."""
-
-    def test_defaults(self):
-        """ConflictError has correct defaults."""
-        error = ConflictError("Resource already exists")
-
-        assert error.message == "Resource already exists"
-        assert error.code == "CONFLICT"
-        assert error.status_code == 409
-
-    def test_with_details(self):
-        """ConflictError accepts details."""
-        error = ConflictError(
-            "Duplicate entry",
-            details={"field": "email", "existing_id": 42},
-        )
-
-        assert error.details == {"field": "email", "existing_id": 42}
-
-
 class TestServiceUnavailableError:
     """Tests for ServiceUnavailableError."""
 
-    def test_default_message(self):
-        """ServiceUnavailableError generates default message."""
-        error = ServiceUnavailableError("Ollama")
-
-        assert error.message == "Ollama service is temporarily unavailable"
-        assert error.code == "SERVICE_UNAVAILABLE"
-        assert error.status_code == 503
-        assert error.details == {"service": "Ollama"}
-
     def test_custom_message(self):
         """ServiceUnavailableError accepts custom message."""
         error = ServiceUnavailableError("OpenAI", "Rate limit exceeded")
@@ -149,15 +139,6 @@ class TestServiceUnavailableError:
 class TestRateLimitError:
     """Tests for RateLimitError."""
 
-    def test_without_retry_after(self):
-        """RateLimitError without retry_after."""
-        error = RateLimitError()
-
-        assert error.message == "Rate limit exceeded. Please try again later."
-        assert error.code == "RATE_LIMIT_EXCEEDED"
-        assert error.status_code == 429
-        assert error.details == {}
-
     def test_with_retry_after(self):
         """RateLimitError with retry_after."""
         error = RateLimitError(retry_after=60)
@@ -223,48 +204,25 @@ class TestFormatErrorResponse:
 class TestExceptionHierarchy:
     """Tests for exception class hierarchy."""
 
-    def test_all_errors_inherit_from_api_error(self):
+    @pytest.mark.parametrize("cls", _ERROR_CLASSES, ids=lambda cls: cls.__name__)
+    def test_all_errors_inherit_from_api_error(self, cls):
         """All custom errors inherit from APIError."""
-        error_classes = [
-            ValidationError,
-            NotFoundError,
-            ConflictError,
-            ServiceUnavailableError,
-            RateLimitError,
-        ]
-
-        for cls in error_classes:
-            assert issubclass(cls, APIError), f"{cls.__name__} should inherit from APIError"
-
-    def test_all_errors_inherit_from_exception(self):
+        assert issubclass(cls, APIError)
+
+    @pytest.mark.parametrize("cls", (APIError,) + _ERROR_CLASSES, ids=lambda cls: cls.__name__)
+    def test_all_errors_inherit_from_exception(self, cls):
         """All custom errors inherit from Exception."""
-        error_classes = [
-            APIError,
-            ValidationError,
-            NotFoundError,
-            ConflictError,
-            ServiceUnavailableError,
-            RateLimitError,
-        ]
-
-        for cls in error_classes:
-            assert issubclass(cls, Exception), f"{cls.__name__} should inherit from Exception"
-
-    def test_can_catch_all_with_api_error(self):
+        assert issubclass(cls, Exception)
+
+    @pytest.mark.parametrize("error", [
+        ValidationError("test"),
+        NotFoundError("test"),
+        ConflictError("test"),
+        ServiceUnavailableError("test"),
+        RateLimitError(),
+    ], ids=lambda error: type(error).__name__)
+    def test_can_catch_all_with_api_error(self, error):
         """Can catch all custom errors with APIError."""
-        errors = [
-            ValidationError("test"),
-            NotFoundError("test"),
-            ConflictError("test"),
-            ServiceUnavailableError("test"),
-            RateLimitError(),
-        ]
-
-        for error in errors:
-            try:
-                raise error
-            except APIError as e:
-                # Should catch all of them
-                assert e.message is not None
-            except Exception:
-                pytest.fail(f"{type(error).__name__} was not caught by APIError handler")
+        with pytest.raises(APIError) as excinfo:
+            raise error
+        assert excinfo.value.message is not None
@@ -1,14 +1,21 @@
 """Unit tests for content extractors (CSS, XPath, Vision)."""
 
 import pytest
+from core.scraping.extractors import css_extractor as css_extractor_module
 from core.scraping.extractors.css_extractor import CSSExtractor
 from core.scraping.extractors.xpath_extractor import XPathExtractor
 
 
+def _assert_contains_all(results, expected):
+    """Assert every expected value was extracted, reporting all that are missing."""
+    missing = set(expected) - set(results)
+    assert not missing, f"missing from results: {sorted(missing)}"
+
+
 class TestCSSExtractor:
     """Tests for CSS selector extraction."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def extractor(self):
         return CSSExtractor()
 
@@ -96,6 +103,30 @@ class TestCSSExtractor:
         assert "/" in results
         assert "/about" in results
 
+    def test_parsed_tree_matches_html(self, extractor, complex_html, complex_tree):
+        """A pre-parsed tree gives the same results as the HTML it came from."""
+        for selector, attribute in (("article", "class"), ("time", "datetime"), ("h2", None)):
+            expected = extractor.extract_one(complex_html, selector, attribute=attribute)
+            assert extractor.extract_one(complex_tree, selector, attribute=attribute) == expected
+        assert extractor.extract_all(complex_tree, "nav a", attribute="href") == \
+            extractor.extract_all(complex_html, "nav a", attribute="href")
+
+    def test_extract_one_attribute_reads_first_match_only(self, extractor):
+        """extract_one() reads the first match, even if a later one has the attribute."""
+        html = '<div><a>No link</a><a href="/later">Later</a></div>'
+        assert extractor.extract_one(html, "a", attribute="href") is None
+
+    def test_extract_all_attribute_skips_missing_and_blank(self, extractor):
+        """Elements without the attribute, or with a blank value, are skipped."""
+        html = '<div><a href=" /one ">1</a><a>2</a><a href="  ">3</a><a href="/four">4</a></div>'
+        assert extractor.extract_all(html, "a", attribute="href") == ["/one", "/four"]
+
+    def test_extract_prefixed_attribute(self, extractor):
+        """Attribute names XPath can't express directly still work."""
+        html = '<svg><use xlink:href="#icon"></use></svg>'
+        assert extractor.extract_one(html, "use", attribute="xlink:href") == "#icon"
+        assert extractor.extract_all(html, "use", attribute="xlink:href") == ["#icon"]
+
     # ========================================================================
     # Edge Cases
     # ========================================================================
@@ -152,11 +183,169 @@ class TestCSSExtractor:
         except Exception:
             pass  # Raising an exception is acceptable
 
+    # ========================================================================
+    # Text Strategy Tests
+    # ========================================================================
+
+    def test_text_strategy_auto_matches_full(self, extractor, complex_html):
+        """The leaf fast path must not change extracted text."""
+        full = CSSExtractor(backend=extractor.backend, text_strategy="full")
+        for selector in ["span.tag", ".post-content p", "h1", "footer p"]:
+            assert extractor.extract_all(complex_html, selector) == full.extract_all(complex_html, selector)
+
+    def test_text_strategy_leaf_only(self, extractor):
+        """leaf_only skips text inside child elements."""
+        leaf = CSSExtractor(backend=extractor.backend, text_strategy="leaf_only")
+        html = "<html><body><p class='x'>Lead <b>bold</b> tail</p></body></html>"
+        assert leaf.extract_one(html, "p.x") == "Lead  tail"
+
+    def test_unknown_text_strategy_rejected(self):
+        """Unknown text strategies should raise."""
+        with pytest.raises(ValueError):
+            CSSExtractor(text_strategy="partial")
+
+    # ========================================================================
+    # Selector Cache Tests
+    # ========================================================================
+
+    def test_compiled_selector_reused(self):
+        """Equal selector strings should share one compiled selector."""
+        from core.scraping.extractors.css_extractor import _compile
+
+        # Build the selector dynamically so it isn't a compile-time constant
+        dynamic = "".join(["ul.", "items", " li"])
+        assert _compile(dynamic) is _compile("ul.items li")
+
+    def test_translation_shared_across_compiled_forms(self):
+        """Each compiled form of a selector reuses one CSS-to-XPath translation."""
+        # Unique per class, since the backend subclasses rerun this test
+        selector = f"section.{type(self).__name__} p"
+        misses = css_extractor_module._css_to_xpath.cache_info().misses
+        css_extractor_module._compile(selector)
+        css_extractor_module._compile_wrapped(selector, css_extractor_module._COUNT_TEMPLATE)
+        css_extractor_module._compile_attribute(selector, "id", True)
+        assert css_extractor_module._css_to_xpath.cache_info().misses == misses + 1
+
+    def test_invalid_selector_cached_as_none(self, extractor, simple_html):
+        """Invalid selectors compile to None and extraction degrades cleanly."""
+        from core.scraping.extractors.css_extractor import _compile
+
+        assert _compile("[[invalid") is None
+        assert extractor.extract_one(simple_html, "[[invalid") is None
+        assert extractor.extract_all(simple_html, "[[invalid") == []
+        assert extractor.exists(simple_html, "[[invalid") is False
+        assert extractor.count(simple_html, "[[invalid") == 0
+
+    def test_exists_and_count_match_extract_all(self, extractor, complex_html):
+        """exists()/count() evaluate in XPath but must agree with extract_all()."""
+        for selector in ["span.tag", "nav a", "h1, time", "div.nonexistent"]:
+            matches = extractor.extract_all(complex_html, selector)
+            assert extractor.count(complex_html, selector) == len(matches)
+            assert extractor.exists(complex_html, selector) is bool(matches)
+
+    def test_class_group_folded_into_one_step(self):
+        """Class-only group members share one step; tag members stay separate."""
+        from core.scraping.extractors.css_extractor import _css_to_xpath
+
+        xpath = _css_to_xpath("h1, .post-title, .article-title")
+        assert xpath.count("|") == 1
+        assert xpath.startswith("descendant-or-self::h1 | ")
+
+    def test_folded_group_matches_in_document_order(self):
+        """Folding a group doesn't change which elements match or their order."""
+        extractor = CSSExtractor()
+        html = """
+        <div>
+            <p class="b">First</p>
+            <h2 class="a">Second</h2>
+            <p class="c">Skipped</p>
+            <span class="a b">Third</span>
+            <h1>Fourth</h1>
+        </div>
+        """
+        assert extractor.extract_all(html, ".a, h1, .b") == ["First", "Second", "Third", "Fourth"]
+        assert extractor.count(html, ".a, .b") == 3
+
+    def test_bare_tag_fast_path_matches_xpath(self, extractor, complex_html):
+        """Bare tag selectors skip XPath but select the same first element."""
+        from core.scraping.extractors.css_extractor import _bare_tag
+
+        assert _bare_tag("h1") == "h1"
+        assert _bare_tag("h1.title") is None
+        for tag in ["h1", "a", "time", "table"]:
+            matches = extractor.extract_all(complex_html, tag)
+            assert extractor.extract_one(complex_html, tag) == (matches[0] if matches else None)
+            assert extractor.exists(complex_html, tag) is bool(matches)
+
+    def test_simple_selector_fast_path_matches_xpath(self, extractor, complex_html):
+        """tag#id.class selectors walk the tree but select the same first element."""
+        from core.scraping.extractors.css_extractor import _simple_selector
+
+        assert _simple_selector("h1.post-title") == ("h1", None, ("post-title",))
+        assert _simple_selector("div#main.a.b") == ("div", "main", ("a", "b"))
+        for selector in ["h1", ".title", "#content", "nav a", "a:first-child", "p.1x"]:
+            assert _simple_selector(selector) is None
+        for selector in ["h1.post-title", "article.post", "span.author", "nav.main-nav",
+                         "div.nonexistent", "article.post.missing"]:
+            matches = extractor.extract_all(complex_html, selector)
+            assert extractor.extract_one(complex_html, selector) == (matches[0] if matches else None)
+        html = '<p id="x" class="a  b">AB</p><p id="y" class="a">A</p>'
+        assert extractor.extract_one(html, "p.b.a") == "AB"
+        assert extractor.extract_one(html, "p#y.a") == "A"
+        assert extractor.extract_one(html, "p#y.b") is None
+
+    def test_simple_selector_fast_path_class_separators(self, extractor):
+        """Only ASCII whitespace separates class tokens, as on the XPath path."""
+        for separator in ("\xa0", "\u2003", "\f"):
+            html = f'<p class="a{separator}b">X</p><p class="a">Y</p><p class="b\ta">Z</p>'
+            for selector in ("p.a", "p.b", "p.a.b"):
+                assert extractor.extract_one(html, selector) == \
+                    (extractor.extract_all(html, selector) or [None])[0]
+
+    def test_bare_tag_includes_root_element(self, extractor):
+        """Like descendant-or-self, a passed-in element can match itself."""
+        from lxml import html
+
+        paragraph = html.fromstring("<p>Only paragraph</p>")
+        assert extractor.extract_one(paragraph, "p") == "Only paragraph"
+        assert extractor.exists(paragraph, "p") is True
+
+    def test_extract_many(self, extractor, simple_html):
+        """extract_many() runs several selectors over one parse."""
+        results = extractor.extract_many(
+            simple_html,
+            {"title": "h1", "items": ".items li", "classes": "h1", "missing": ".nope", "bad": "[[["},
+            attributes={"classes": "class"},
+        )
+        assert results == {
+            "title": ["Hello World"],
+            "items": ["Item 1", "Item 2", "Item 3"],
+            "classes": ["title"],
+            "missing": [],
+            "bad": [],
+        }
+
+
+@pytest.mark.skipif(
+    not css_extractor_module.HAS_SELECTOLAX, reason="selectolax not installed"
+)
+class TestCSSExtractorSelectolax(TestCSSExtractor):
+    """Run the CSS extractor tests against the selectolax backend."""
+
+    @pytest.fixture(scope="class")
+    def extractor(self):
+        return CSSExtractor(backend="selectolax")
+
+    def test_unknown_backend_rejected(self):
+        """Unknown backend names should raise."""
+        with pytest.raises(ValueError):
+            CSSExtractor(backend="beautifulsoup")
+
 
 class TestXPathExtractor:
     """Tests for XPath extraction."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def extractor(self):
         return XPathExtractor()
 
@@ -169,6 +358,11 @@ class TestXPathExtractor:
         result = extractor.extract_one(simple_html, "//h1")
         assert result == "Hello World"
 
+    def test_extract_from_parsed_tree(self, extractor, simple_tree):
+        """A pre-parsed tree is used as-is."""
+        assert extractor.extract_one(simple_tree, "//h1") == "Hello World"
+        assert extractor.extract_all(simple_tree, "//ul[@class='items']/li") == ["Item 1", "Item 2", "Item 3"]
+
     def test_extract_by_class(self, extractor, simple_html):
         """Extract element by class attribute."""
         result = extractor.extract_one(simple_html, "//h1[@class='title']")
@@ -257,11 +451,108 @@ class TestXPathExtractor:
         except Exception:
             pass  # Expected to raise
 
+    def test_expression_compiled_once(self, extractor, simple_html):
+        """Repeated expressions should reuse one compiled XPath."""
+        from core.scraping.extractors.xpath_cache import compile_xpath
+
+        assert extractor.extract_one(simple_html, "//h1") == "Hello World"
+        assert extractor.count(simple_html, "//li") == 3
+        assert compile_xpath("//h1") is compile_xpath("//h1")
+
+    def test_invalid_xpath_cached(self, extractor, simple_html):
+        """Invalid XPath is compiled once and keeps returning empty results."""
+        from core.scraping.extractors.xpath_cache import compile_xpath
+
+        for _ in range(2):
+            assert extractor.extract_one(simple_html, "///invalid[[") is None
+            assert extractor.extract_all(simple_html, "///invalid[[") == []
+        assert compile_xpath("///invalid[[") is None
+
+    def test_compiled_xpath_shared_with_css(self, extractor, simple_html):
+        """A CSS selector and its XPath translation share one compiled expression."""
+        from core.scraping.extractors.css_extractor import _compile as compile_css, _css_to_xpath
+        from core.scraping.extractors.xpath_cache import compile_xpath
+
+        selector = "ul.items > li"
+        xpath = _css_to_xpath(selector)
+        assert extractor.extract_all(simple_html, xpath) == ["Item 1", "Item 2", "Item 3"]
+        assert compile_css(selector) is compile_xpath(xpath)
+
+
+class TestTreeCache:
+    """Tests for the shared parsed-tree cache."""
+
+    def test_same_content_parsed_once(self, simple_html):
+        """Identical HTML content should reuse one parsed tree."""
+        from core.scraping.extractors.tree_cache import get_tree, clear_cache
+
+        clear_cache()
+        copy = "".join(list(simple_html))
+        assert copy is not simple_html
+        assert get_tree(copy) is get_tree(simple_html)
+
+    def test_clear_cache(self, simple_html):
+        """clear_cache() should force a fresh parse."""
+        from core.scraping.extractors.tree_cache import get_tree, clear_cache
+
+        first = get_tree(simple_html)
+        clear_cache()
+        assert get_tree(simple_html) is not first
+
+    def test_extractors_share_trees(self, simple_html):
+        """CSS and XPath extraction on the same page should parse it once."""
+        from core.scraping.extractors.tree_cache import cache_info, clear_cache
+
+        clear_cache()
+        CSSExtractor().extract_one(simple_html, "h1")
+        XPathExtractor().extract_one(simple_html, "//h1")
+        info = cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
+    def test_parsed_tree_passed_through(self, simple_html):
+        """An already-parsed tree is used as-is."""
+        from lxml import html
+        from core.scraping.extractors.tree_cache import get_tree
+
+        tree = html.fromstring(simple_html)
+        assert get_tree(tree) is tree
+
+    def test_comments_and_pis_kept_for_xpath(self):
+        """User XPath sees comments, PIs and comment-split text nodes."""
+        html = "<div><?php echo 1 ?><p>Before <!-- note --> after</p><!-- end --></div>"
+        xpath = XPathExtractor()
+        # Newer libxml2 reads "<?php ?>" in HTML as a comment, older as a PI
+        assert xpath.count(html, "//comment() | //processing-instruction()") == 3
+        assert xpath.extract_all(html, "//p/text()") == ["Before", "after"]
+        # CSS text extraction still skips the comment itself
+        assert CSSExtractor().extract_one(html, "p") == "Before  after"
+
+    def test_parsers_are_per_thread(self):
+        """Each thread parses with its own parser objects, reused across calls."""
+        import threading
+        from core.scraping.extractors import tree_cache
+
+        other = []
+        thread = threading.Thread(target=lambda: other.append(tree_cache._parsers()))
+        thread.start()
+        thread.join()
+
+        assert tree_cache._parsers() is tree_cache._parsers()
+        assert set(other[0]).isdisjoint(tree_cache._parsers())
+
+    def test_id_lookups(self):
+        """IDs are indexed, so XPath id() works alongside attribute-based lookups."""
+        html = "<div><p id='lead'>Lead</p><p id='lead'>Duplicate</p></div>"
+        assert CSSExtractor().extract_all(html, "#lead") == ["Lead", "Duplicate"]
+        assert XPathExtractor().extract_one(html, "//*[@id='lead']") == "Lead"
+        assert XPathExtractor().extract_one(html, "id('lead')") == "Lead"
+
 
 class TestVisionExtractor:
     """Tests for vision-based OCR extraction."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def extractor(self):
         """Get vision extractor if available."""
         from core.scraping.extractors.vision_extractor import VisionExtractor
@@ -280,6 +571,91 @@ class TestVisionExtractor:
         result = VisionExtractor.is_available()
         assert isinstance(result, bool)
 
+    def test_module_import_skips_ocr_stack(self):
+        """Importing the extractor package must not import Pillow or pytesseract."""
+        import subprocess
+        import sys
+        from pathlib import Path
+
+        code = (
+            "import sys, core.scraping.extractors; "
+            "assert 'PIL' not in sys.modules and 'pytesseract' not in sys.modules"
+        )
+        root = Path(__file__).resolve().parents[2]
+        result = subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True)
+        assert result.returncode == 0, result.stderr.decode()
+
+    def test_tesseract_api_reused_per_language(self):
+        """Pooled tesserocr engines are reused instead of rebuilt per call."""
+        from core.scraping.extractors import vision_extractor
+        if not vision_extractor.HAS_TESSEROCR:
+            pytest.skip("tesserocr not installed")
+
+        pool = vision_extractor._TesseractAPIPool()
+        with pool.acquire("eng") as first:
+            pass
+        with pool.acquire("eng") as second:
+            assert second is first
+
+    def test_tesserocr_init_failure_falls_back(self, monkeypatch):
+        """A tesserocr engine that can't start (e.g. bad tessdata) hands OCR to pytesseract."""
+        import sys
+        from types import SimpleNamespace
+        from core.scraping.extractors import vision_extractor
+
+        attempts = []
+
+        def broken_api(lang):
+            attempts.append(lang)
+            raise RuntimeError("Failed to init API, possibly an invalid tessdata path")
+
+        fake_pytesseract = SimpleNamespace(
+            image_to_string=lambda image, lang, config: " Fallback text ",
+            image_to_data=lambda image, lang, output_type: {"conf": [80, -1, 90]},
+            Output=SimpleNamespace(DICT="dict"),
+        )
+        monkeypatch.setitem(sys.modules, "tesserocr", SimpleNamespace(PyTessBaseAPI=broken_api))
+        monkeypatch.setattr(vision_extractor, "HAS_TESSEROCR", True)
+        monkeypatch.setattr(vision_extractor, "_api_pool", vision_extractor._TesseractAPIPool())
+        monkeypatch.setattr(vision_extractor, "pytesseract", fake_pytesseract)
+
+        # _ocr() takes a decoded image, so no Pillow/Tesseract install is needed here
+        extractor = object.__new__(vision_extractor.VisionExtractor)
+        for _ in range(2):
+            result = extractor._ocr(object(), "eng")
+            assert result.success
+            assert result.text == "Fallback text"
+            assert result.confidence == pytest.approx(0.85)
+        assert attempts == ["eng"]  # a failed language isn't retried
+
+    def test_threshold_lut_binarizes(self):
+        """The threshold table maps grayscale to pure black/white in 'L' mode."""
+        from core.scraping.extractors import vision_extractor
+        Image = pytest.importorskip("PIL.Image")
+
+        image = Image.new("L", (4, 1))
+        image.putdata([0, 128, 129, 255])
+        result = image.point(vision_extractor._THRESHOLD_LUT)
+        assert result.mode == "L"
+        assert list(result.getdata()) == [0, 0, 255, 255]
+
+    def test_text_region_is_slotted(self):
+        """OCR regions carry no per-instance __dict__ and are immutable."""
+        import dataclasses
+        from core.scraping.extractors.vision_extractor import TextRegion
+        region = TextRegion(text="Price", x=1, y=2, width=30, height=10, confidence=91.0)
+        assert not hasattr(region, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            region.x = 5
+
+    def test_availability_probed_once(self):
+        """Repeated availability checks reuse the first probe."""
+        from core.scraping.extractors.vision_extractor import VisionExtractor
+        first = VisionExtractor.is_available()
+        hits = VisionExtractor.is_available.cache_info().hits
+        assert VisionExtractor.is_available() == first
+        assert VisionExtractor.is_available.cache_info().hits == hits + 1
+
     def test_get_vision_extractor_singleton(self):
         """Test singleton getter function."""
         from core.scraping.extractors.vision_extractor import get_vision_extractor
@@ -391,13 +767,13 @@ class TestBooksToScrapePureExtraction:
 
     These tests verify extraction logic WITHOUT any HTTP calls, following
     TDD best practices of separating data transformation from I/O.
-    """
 
-    @pytest.fixture
-    def css_extractor(self):
-        return CSSExtractor()
+    Pages are passed as session-scoped parsed trees, so each is parsed
+    once no matter how many selectors run against it. Every fixture here
+    is shared and read-only, so the tests shard freely under pytest -n.
+    """
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def xpath_extractor(self):
         return XPathExtractor()
 
@@ -405,62 +781,62 @@ class TestBooksToScrapePureExtraction:
     # Book Detail Page Extraction
     # ========================================================================
 
-    def test_extract_book_title(self, css_extractor, books_to_scrape_book, books_to_scrape_selectors):
+    def test_extract_book_title(self, css_extractor, books_to_scrape_book_tree, books_to_scrape_selectors):
         """Extract book title from detail page."""
         result = css_extractor.extract_one(
-            books_to_scrape_book,
+            books_to_scrape_book_tree,
             books_to_scrape_selectors["title"]
         )
         assert result == "A Light in the Attic"
 
-    def test_extract_book_price(self, css_extractor, books_to_scrape_book, books_to_scrape_selectors):
+    def test_extract_book_price(self, css_extractor, books_to_scrape_book_tree, books_to_scrape_selectors):
         """Extract book price from detail page."""
         result = css_extractor.extract_one(
-            books_to_scrape_book,
+            books_to_scrape_book_tree,
             books_to_scrape_selectors["price"]
         )
         assert result == "£51.77"
 
-    def test_extract_book_availability(self, css_extractor, books_to_scrape_book, books_to_scrape_selectors):
+    def test_extract_book_availability(self, css_extractor, books_to_scrape_book_tree, books_to_scrape_selectors):
         """Extract availability status from detail page."""
         result = css_extractor.extract_one(
-            books_to_scrape_book,
+            books_to_scrape_book_tree,
             books_to_scrape_selectors["availability"]
         )
         assert "In stock" in result
         assert "22 available" in result
 
-    def test_extract_book_upc(self, css_extractor, books_to_scrape_book, books_to_scrape_selectors):
+    def test_extract_book_upc(self, css_extractor, books_to_scrape_book_tree, books_to_scrape_selectors):
         """Extract UPC from product table."""
         result = css_extractor.extract_one(
-            books_to_scrape_book,
+            books_to_scrape_book_tree,
             books_to_scrape_selectors["upc"]
         )
         assert result == "a897fe39b1053632"
 
-    def test_extract_book_rating_class(self, css_extractor, books_to_scrape_book, books_to_scrape_selectors):
+    def test_extract_book_rating_class(self, css_extractor, books_to_scrape_book_tree, books_to_scrape_selectors):
         """Extract rating from class attribute."""
         result = css_extractor.extract_one(
-            books_to_scrape_book,
+            books_to_scrape_book_tree,
             books_to_scrape_selectors["rating"],
             attribute="class"
         )
         assert "Three" in result  # 3-star rating
 
-    def test_extract_breadcrumb_navigation(self, css_extractor, books_to_scrape_book, books_to_scrape_selectors):
+    def test_extract_breadcrumb_navigation(self, css_extractor, books_to_scrape_book_tree, books_to_scrape_selectors):
         """Extract breadcrumb trail."""
         results = css_extractor.extract_all(
-            books_to_scrape_book,
+            books_to_scrape_book_tree,
             books_to_scrape_selectors["breadcrumb"]
         )
         assert len(results) == 4  # Home > Books > Poetry > Title
         assert "Home" in results[0]
         assert "Poetry" in results[2]
 
-    def test_extract_description(self, css_extractor, books_to_scrape_book, books_to_scrape_selectors):
+    def test_extract_description(self, css_extractor, books_to_scrape_book_tree, books_to_scrape_selectors):
         """Extract product description."""
         result = css_extractor.extract_one(
-            books_to_scrape_book,
+            books_to_scrape_book_tree,
             books_to_scrape_selectors["description"]
         )
         assert "Shel Silverstein" in result
@@ -470,99 +846,112 @@ class TestBooksToScrapePureExtraction:
     # Catalog Page Extraction
     # ========================================================================
 
-    def test_extract_all_books_from_catalog(self, css_extractor, books_to_scrape_catalog, books_to_scrape_selectors):
+    def test_extract_all_books_from_catalog(self, css_extractor, books_to_scrape_catalog_tree, books_to_scrape_selectors):
         """Extract all book articles from catalog page."""
         results = css_extractor.extract_all(
-            books_to_scrape_catalog,
+            books_to_scrape_catalog_tree,
             books_to_scrape_selectors["books"]
         )
         # Fixture has 3 books
         assert len(results) == 3
 
-    def test_extract_book_titles_from_catalog(self, css_extractor, books_to_scrape_catalog, books_to_scrape_selectors):
+    def test_extract_book_titles_from_catalog(self, css_extractor, books_to_scrape_catalog_tree, books_to_scrape_selectors):
         """Extract all book titles from catalog page."""
         results = css_extractor.extract_all(
-            books_to_scrape_catalog,
+            books_to_scrape_catalog_tree,
             books_to_scrape_selectors["book_title"],
             attribute="title"
         )
-        assert "A Light in the Attic" in results
-        assert "Tipping the Velvet" in results
-        assert "Soumission" in results
+        _assert_contains_all(results, ["A Light in the Attic", "Tipping the Velvet", "Soumission"])
 
-    def test_extract_book_prices_from_catalog(self, css_extractor, books_to_scrape_catalog, books_to_scrape_selectors):
+    def test_extract_book_prices_from_catalog(self, css_extractor, books_to_scrape_catalog_tree, books_to_scrape_selectors):
         """Extract all book prices from catalog page."""
         results = css_extractor.extract_all(
-            books_to_scrape_catalog,
+            books_to_scrape_catalog_tree,
             books_to_scrape_selectors["book_price"]
         )
         assert len(results) == 3
-        assert "£51.77" in results
-        assert "£53.74" in results
-        assert "£50.10" in results
+        _assert_contains_all(results, ["£51.77", "£53.74", "£50.10"])
 
-    def test_extract_book_links_from_catalog(self, css_extractor, books_to_scrape_catalog, books_to_scrape_selectors):
+    def test_extract_book_links_from_catalog(self, css_extractor, books_to_scrape_catalog_tree, books_to_scrape_selectors):
         """Extract all book links from catalog page."""
         results = css_extractor.extract_all(
-            books_to_scrape_catalog,
+            books_to_scrape_catalog_tree,
             books_to_scrape_selectors["book_link"],
             attribute="href"
         )
         assert len(results) == 3
         assert "a-light-in-the-attic_1000/index.html" in results
 
-    def test_extract_pagination_info(self, css_extractor, books_to_scrape_catalog, books_to_scrape_selectors):
+    def test_extract_pagination_info(self, css_extractor, books_to_scrape_catalog_tree, books_to_scrape_selectors):
         """Extract pagination text."""
         result = css_extractor.extract_one(
-            books_to_scrape_catalog,
+            books_to_scrape_catalog_tree,
             books_to_scrape_selectors["pagination"]
         )
         assert "Page 1 of 50" in result
 
-    def test_extract_next_page_link(self, css_extractor, books_to_scrape_catalog, books_to_scrape_selectors):
+    def test_extract_next_page_link(self, css_extractor, books_to_scrape_catalog_tree, books_to_scrape_selectors):
         """Extract next page URL."""
         result = css_extractor.extract_one(
-            books_to_scrape_catalog,
+            books_to_scrape_catalog_tree,
             books_to_scrape_selectors["next_page"],
             attribute="href"
         )
         assert result == "page-2.html"
 
+    def test_extract_many_from_catalog(self, css_extractor, books_to_scrape_catalog_tree, books_to_scrape_selectors):
+        """One extract_many() call matches per-selector extract_all() results."""
+        keys = ("books", "book_title", "book_price", "book_link", "pagination", "next_page")
+        selectors = {key: books_to_scrape_selectors[key] for key in keys}
+        attributes = {"book_title": "title", "book_link": "href", "next_page": "href"}
+
+        results = css_extractor.extract_many(books_to_scrape_catalog_tree, selectors, attributes)
+
+        assert list(results) == list(keys)
+        for key in keys:
+            assert results[key] == css_extractor.extract_all(
+                books_to_scrape_catalog_tree, selectors[key], attributes.get(key)
+            )
+        assert results["book_price"] == ["£51.77", "£53.74", "£50.10"]
+        assert results["next_page"] == ["page-2.html"]
+
     # ========================================================================
     # XPath Equivalents (Same Tests, Different Syntax)
     # ========================================================================
 
-    def test_xpath_extract_book_title(self, xpath_extractor, books_to_scrape_book):
+    def test_xpath_extract_book_title(self, xpath_extractor, books_to_scrape_book_tree):
         """Extract book title using XPath."""
         result = xpath_extractor.extract_one(
-            books_to_scrape_book,
+            books_to_scrape_book_tree,
             "//article[contains(@class, 'product_page')]//h1"
         )
         assert result == "A Light in the Attic"
 
-    def test_xpath_extract_book_price(self, xpath_extractor, books_to_scrape_book):
+    def test_xpath_extract_book_price(self, xpath_extractor, books_to_scrape_book_tree):
         """Extract book price using XPath."""
         result = xpath_extractor.extract_one(
-            books_to_scrape_book,
+            books_to_scrape_book_tree,
             "//p[@class='price_color']"
         )
         assert result == "£51.77"
 
-    def test_xpath_extract_table_data(self, xpath_extractor, books_to_scrape_book):
+    def test_xpath_extract_table_data(self, xpath_extractor, books_to_scrape_book_tree):
         """Extract data from product info table using XPath."""
         result = xpath_extractor.extract_one(
-            books_to_scrape_book,
+            books_to_scrape_book_tree,
             "//table//tr[th[text()='UPC']]/td"
         )
         assert result == "a897fe39b1053632"
 
-    def test_xpath_extract_all_prices_from_catalog(self, xpath_extractor, books_to_scrape_catalog):
+    def test_xpath_extract_all_prices_from_catalog(self, xpath_extractor, books_to_scrape_catalog_tree):
         """Extract all prices from catalog using XPath."""
         results = xpath_extractor.extract_all(
-            books_to_scrape_catalog,
+            books_to_scrape_catalog_tree,
             "//article[contains(@class, 'product_pod')]//p[@class='price_color']"
         )
         assert len(results) == 3
+        _assert_contains_all(results, ["£51.77", "£53.74", "£50.10"])
 
 
 # ============================================================================
@@ -597,20 +986,19 @@ class TestDataCleaning:
         def parse_availability(text: str) -> tuple:
             """Pure function to parse availability."""
             import re
-            text_lower = text.lower().strip()
+            text_lower = text.strip().lower()
 
-            if "out of stock" in text_lower:
+            # Availability text always leads with the stock status
+            if not text_lower.startswith("in stock"):
                 return (False, 0)
 
             match = re.search(r'(\d+)\s*available', text_lower)
-            count = int(match.group(1)) if match else 0
-            in_stock = "in stock" in text_lower
-
-            return (in_stock, count)
+            return (True, int(match.group(1)) if match else 0)
 
         assert parse_availability("In stock (22 available)") == (True, 22)
         assert parse_availability("In stock (1 available)") == (True, 1)
         assert parse_availability("Out of stock") == (False, 0)
+        assert parse_availability("  In stock  ") == (True, 0)
 
     def test_star_rating_from_class(self):
         """Test parsing star rating from CSS class."""
@@ -619,14 +1007,15 @@ class TestDataCleaning:
             rating_map = {
                 "One": 1, "Two": 2, "Three": 3, "Four": 4, "Five": 5
             }
-            for word, value in rating_map.items():
-                if word in class_str:
-                    return value
-            return 0
+            # The rating word is the last class token ("star-rating Three")
+            tokens = class_str.split()
+            return rating_map.get(tokens[-1], 0) if tokens else 0
 
         assert parse_rating("star-rating Three") == 3
         assert parse_rating("star-rating Five") == 5
         assert parse_rating("star-rating One") == 1
+        assert parse_rating("star-rating") == 0
+        assert parse_rating("") == 0
 
     def test_url_normalization(self):
         """Test normalizing relative URLs to absolute."""
@@ -643,10 +1032,8 @@ class TestDataCleaning:
         """Test cleaning extracted text."""
         def clean_text(text: str) -> str:
             """Pure function to clean text."""
-            import re
-            # Normalize whitespace
-            text = re.sub(r'\s+', ' ', text)
-            return text.strip()
+            # split() drops leading/trailing whitespace and collapses runs
+            return " ".join(text.split())
 
         assert clean_text("  Multiple   spaces   here  ") == "Multiple spaces here"
         assert clean_text("\n\nNew\nlines\n\n") == "New lines"
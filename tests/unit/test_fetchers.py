@@ -17,6 +17,17 @@ class TestHTTPFetcher:
         """Fetcher should initialize properly."""
         assert fetcher is not None
 
+    def test_connection_pool_shared_cookies_separate(self, fetcher):
+        """Fetchers share one connection pool but keep their own cookies."""
+        from core.scraping.fetchers.http_fetcher import HTTPFetcher
+        other = HTTPFetcher()
+
+        for url in ("http://example.com", "https://example.com"):
+            assert fetcher.session.get_adapter(url) is other.session.get_adapter(url)
+
+        fetcher.session.cookies.set("session_id", "abc")
+        assert "session_id" not in other.session.cookies
+
     def test_user_agent_rotation(self, fetcher):
         """User agent should be rotated."""
         import config
@@ -215,6 +226,20 @@ class TestAgentBrowserFetcher:
         assert "test" in call_args
         assert "arg" in call_args
 
+    def test_aria_snapshot_refs(self, fetcher):
+        """Interactive roles get sequential refs; other lines pass through."""
+        snapshot = '- document:\n  - heading "Title" [level=1]\n  - button "Submit"\n  - link "More":'
+        refs = {}
+        tree = fetcher._parse_aria_snapshot(snapshot, refs)
+
+        assert tree.splitlines() == [
+            "- document:",
+            '  - heading "Title" [level=1]',
+            '  - @e1 button "Submit"',
+            '  - @e2 link "More":',
+        ]
+        assert {ref: info["role"] for ref, info in refs.items()} == {"@e1": "button", "@e2": "link"}
+
     def test_ref_extraction(self, fetcher):
         """Element refs should be extracted from snapshot."""
         # Check if the method exists
@@ -318,3 +343,21 @@ class TestFetcherRegistry:
             # All should have fetch method
             assert hasattr(fetcher, 'fetch')
             assert callable(fetcher.fetch)
+
+    @pytest.mark.parametrize("module, name", [
+        ("http_fetcher", "FetchResult"),
+        ("playwright_fetcher", "PlaywrightResult"),
+        ("puppeteer_fetcher", "PuppeteerResult"),
+        ("agent_browser_fetcher", "AgentBrowserResult"),
+        ("browser_use_fetcher", "BrowserUseResult"),
+    ])
+    def test_results_are_slotted_and_frozen(self, module, name):
+        """Fetch results carry no per-instance __dict__ and are immutable."""
+        import dataclasses
+        import importlib
+
+        result_cls = getattr(importlib.import_module(f"core.scraping.fetchers.{module}"), name)
+        result = result_cls(success=True, html="<html></html>")
+        assert not hasattr(result, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.html = ""
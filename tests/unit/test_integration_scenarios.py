@@ -4,25 +4,28 @@ Integration scenario tests combining multiple components.
 
 import pytest
 
+_PRODUCT_HTML = """
+<html><body>
+<h1>Title</h1>
+<span class="price">$99</span>
+<div data-id="123">Content</div>
+</body></html>
+"""
+
 
 class TestIntegrationScenarios:
     """Tests for end-to-end scraping scenarios."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def engine(self):
         from core.scraping.engine import ScrapingEngine
         return ScrapingEngine()
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def detector(self):
         from core.poison_pills.detector import PoisonPillDetector
         return PoisonPillDetector()
 
-    @pytest.fixture
-    def css_extractor(self):
-        from core.scraping.extractors.css_extractor import CSSExtractor
-        return CSSExtractor()
-
     # Engine test_selector method
     def test_engine_css_selector(self, engine):
         """Test engine CSS selector testing."""
@@ -123,6 +126,12 @@ class TestIntegrationScenarios:
         assert result.pill_type == "paywall_detected"
 
     # Data extraction scenarios
+    @pytest.fixture(scope="class")
+    def product_tree(self):
+        """Page shared by the selector-type cases, parsed once."""
+        from core.scraping.extractors.tree_cache import get_tree
+        return get_tree(_PRODUCT_HTML)
+
     @pytest.mark.parametrize("selector_type,selector,expected", [
         ("css", "h1", "Title"),
         ("css", ".price", "$99"),
@@ -130,19 +139,18 @@ class TestIntegrationScenarios:
         ("xpath", "//h1", "Title"),
         ("xpath", "//span[@class='price']", "$99"),
     ])
-    def test_selector_types(self, engine, selector_type, selector, expected):
+    def test_selector_types(self, engine, product_tree, selector_type, selector, expected):
         """Test different selector types."""
-        html = """
-        <html><body>
-        <h1>Title</h1>
-        <span class="price">$99</span>
-        <div data-id="123">Content</div>
-        </body></html>
-        """
-        result = engine.test_selector(html, selector_type, selector)
+        result = engine.test_selector(product_tree, selector_type, selector)
         assert result["success"]
         assert any(expected in str(m) for m in result["matches"])
 
+    def test_selector_html_and_tree_agree(self, engine, product_tree):
+        """test_selector() gives the same result for raw HTML and its parsed tree."""
+        for selector_type, selector in (("css", ".price"), ("xpath", "//h1")):
+            assert engine.test_selector(_PRODUCT_HTML, selector_type, selector) == \
+                engine.test_selector(product_tree, selector_type, selector)
+
 
 class TestResultDataclasses:
     """Tests for result dataclass structures."""
@@ -201,12 +209,7 @@ class TestResultDataclasses:
 class TestExtractionIntegration:
     """Integration tests for extraction components."""
 
-    @pytest.fixture
-    def css_extractor(self):
-        from core.scraping.extractors.css_extractor import CSSExtractor
-        return CSSExtractor()
-
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def xpath_extractor(self):
         from core.scraping.extractors.xpath_extractor import XPathExtractor
         return XPathExtractor()
@@ -269,6 +272,12 @@ class TestExtractionIntegration:
         assert names == ["Item A", "Item B"]
         assert prices == ["$10", "$20"]
 
+        # Several selectors over one document: extract_many() parses it once
+        columns = css_extractor.extract_many(
+            html, {"headers": "th", "names": "tr td:first-child", "prices": "tr td:last-child"}
+        )
+        assert columns == {"headers": headers, "names": names, "prices": prices}
+
 
 # ============================================================================
 # ADDITIONAL INTEGRATION SCENARIOS
@@ -278,17 +287,12 @@ class TestExtractionIntegration:
 class TestDetectorExtractorIntegration:
     """Tests combining poison pill detection with extraction."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def detector(self):
         from core.poison_pills.detector import PoisonPillDetector
         return PoisonPillDetector()
 
-    @pytest.fixture
-    def css_extractor(self):
-        from core.scraping.extractors.css_extractor import CSSExtractor
-        return CSSExtractor()
-
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def xpath_extractor(self):
         from core.scraping.extractors.xpath_extractor import XPathExtractor
         return XPathExtractor()
@@ -361,7 +365,7 @@ class TestDetectorExtractorIntegration:
 class TestEngineIntegration:
     """Tests for scraping engine integration."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def engine(self):
         from core.scraping.engine import ScrapingEngine
         return ScrapingEngine()
@@ -415,17 +419,12 @@ class TestEngineIntegration:
 class TestMultipleExtractorWorkflows:
     """Tests for workflows using multiple extractors."""
 
-    @pytest.fixture
-    def css_extractor(self):
-        from core.scraping.extractors.css_extractor import CSSExtractor
-        return CSSExtractor()
-
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def xpath_extractor(self):
         from core.scraping.extractors.xpath_extractor import XPathExtractor
         return XPathExtractor()
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def meta_extractor(self):
         from core.scraping.extractors.css_extractor import MetaExtractor
         return MetaExtractor()
@@ -521,6 +520,17 @@ class TestPoisonPillResultIntegration:
         assert result_dict["pill_type"] == "rate_limited"
         assert result_dict["retry_possible"] is True
 
+    def test_result_to_dict_matches_asdict(self):
+        """to_dict() gives the asdict() result without sharing the details dict."""
+        from core.poison_pills.types import PoisonPillResult, PoisonPillType
+        from dataclasses import asdict
+
+        for result in (PoisonPillResult.clean(), PoisonPillResult.detected(PoisonPillType.CAPTCHA, message="x")):
+            result_dict = result.to_dict()
+            assert result_dict == asdict(result)
+            assert result_dict["details"] is not result.details
+        assert not hasattr(PoisonPillResult.clean(), "__dict__")
+
     def test_all_poison_types_have_actions(self):
         """Test that all poison types have recommended actions."""
         from core.poison_pills.types import PoisonPillResult, PoisonPillType
@@ -546,12 +556,7 @@ class TestPoisonPillResultIntegration:
 class TestExtractionErrorHandling:
     """Tests for error handling in extraction workflows."""
 
-    @pytest.fixture
-    def css_extractor(self):
-        from core.scraping.extractors.css_extractor import CSSExtractor
-        return CSSExtractor()
-
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def xpath_extractor(self):
         from core.scraping.extractors.xpath_extractor import XPathExtractor
         return XPathExtractor()
@@ -595,12 +600,7 @@ class TestExtractionErrorHandling:
 class TestBooksToScrapeIntegration:
     """Integration tests using Books to Scrape fixtures."""
 
-    @pytest.fixture
-    def css_extractor(self):
-        from core.scraping.extractors.css_extractor import CSSExtractor
-        return CSSExtractor()
-
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def detector(self):
         from core.poison_pills.detector import PoisonPillDetector
         return PoisonPillDetector()
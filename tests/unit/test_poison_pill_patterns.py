@@ -24,7 +24,7 @@ import config
 # Fixture: Detector instance
 # ============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def detector():
     """Create a detector instance."""
     return PoisonPillDetector()
@@ -1,37 +1,15 @@
 """Unit tests for poison pill detection."""
 
 import pytest
-from core.poison_pills.detector import PoisonPillDetector
+from core.poison_pills.detector import PoisonPillDetector, HAS_RE2
 from core.poison_pills.types import PoisonPillType
-
-
-# Helper to pad HTML with sufficient content to pass minimum length checks
-# Poison pill detector requires: >= 500 chars AND >= 50 words in TEXT content
-# We need significant padding because the detector strips HTML tags before counting words
-PADDING_PARAGRAPH = """
-<p>This paragraph provides sufficient padding content to meet the minimum requirements
-for the poison pill detector system. The detector component checks for minimum character
-count and word count before analyzing for specific poison pill patterns and indicators.
-Without this substantial padding text, tests would incorrectly fail with content_too_short
-error instead of detecting the actual pattern being tested. This padding ensures proper
-test isolation and accurate detection verification. We include many additional words here
-to guarantee the word count threshold is met regardless of the base HTML content size.
-The padding must be long enough to work with even the shortest test cases in this suite.</p>
-"""  # ~100 words of padding text
-
-
-def pad_html(base_html):
-    """Add padding to HTML to meet minimum content requirements (500 chars, 50 words)."""
-    # Insert before closing body tag
-    if "</body>" in base_html:
-        return base_html.replace("</body>", PADDING_PARAGRAPH + "</body>")
-    return base_html + PADDING_PARAGRAPH
+from tests.conftest import pad_html
 
 
 class TestPoisonPillDetector:
     """Tests for the PoisonPillDetector class."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def detector(self):
         return PoisonPillDetector()
 
@@ -314,6 +292,47 @@ class TestPoisonPillDetector:
         assert len(result.recommended_action) > 0
 
 
+class TestPoisonPillDetectorStdlibEngine(TestPoisonPillDetector):
+    """Re-run the detector tests with the stdlib regex engine forced."""
+
+    @pytest.fixture(scope="class")
+    def detector(self):
+        return PoisonPillDetector(engine="re")
+
+    def test_unknown_engine_rejected(self):
+        with pytest.raises(ValueError):
+            PoisonPillDetector(engine="pcre")
+
+
+@pytest.mark.skipif(not HAS_RE2, reason="google-re2 not installed")
+class TestPoisonPillDetectorRe2Engine(TestPoisonPillDetector):
+    """Re-run the detector tests with the RE2 engine."""
+
+    @pytest.fixture(scope="class")
+    def detector(self):
+        return PoisonPillDetector(engine="re2")
+
+    def test_engines_agree(self, detector):
+        """Both engines should flag the same pill on every pattern set."""
+        stdlib = PoisonPillDetector(engine="re")
+        pages = [
+            pad_html("<html><body><p>Subscribe to read the full story</p></body></html>"),
+            pad_html("<html><body><p>Too many requests, try again in 30 seconds</p></body></html>"),
+            pad_html("<html><body><p>Please verify you are human</p></body></html>"),
+            pad_html("<html><body><p>Please log in to continue</p></body></html>"),
+            pad_html("<html><body><p>An ordinary article body</p></body></html>"),
+            # Unicode whitespace: RE2's own \s only matches ASCII
+            pad_html("<html><body><p>Please try\xa0again later</p></body></html>"),
+            pad_html("<html><body><p>Members\xa0only article</p></body></html>"),
+            pad_html("<html><body><p>Premium\u2003content ahead</p></body></html>"),
+            pad_html("<html><body><p>Try again in \u0663\u0660 seconds</p></body></html>"),
+        ]
+        for page in pages:
+            assert detector.detect(page).pill_type == stdlib.detect(page).pill_type
+        assert stdlib.detect(pages[5]).pill_type == "rate_limited"
+        assert stdlib.detect(pages[7]).pill_type == "paywall_detected"
+
+
 class TestPoisonPillResult:
     """Tests for PoisonPillResult class."""
 
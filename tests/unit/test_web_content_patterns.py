@@ -13,7 +13,7 @@ Tests cover extraction from realistic HTML patterns found in:
 import pytest
 from tests.conftest import pad_html
 
-from core.scraping.extractors.css_extractor import CSSExtractor, MetaExtractor
+from core.scraping.extractors.css_extractor import MetaExtractor
 from core.scraping.extractors.xpath_extractor import XPathExtractor
 
 
@@ -21,17 +21,12 @@ from core.scraping.extractors.xpath_extractor import XPathExtractor
 # Fixtures
 # ============================================================================
 
-@pytest.fixture
-def css_extractor():
-    return CSSExtractor()
-
-
-@pytest.fixture
+@pytest.fixture(scope="session")
 def xpath_extractor():
     return XPathExtractor()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def meta_extractor():
     return MetaExtractor()
 
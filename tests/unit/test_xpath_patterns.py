@@ -19,7 +19,7 @@ from core.scraping.extractors.xpath_extractor import XPathExtractor
 # Fixture: Extractor instance
 # ============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def extractor():
     """Create an XPath extractor instance."""
     return XPathExtractor()